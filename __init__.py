@@ -1,3 +1,12 @@
-import SGDPyUtil.powershell_utils
-import SGDPyUtil.logging_utils
-import SGDPyUtil.singleton_utils
+""" submodules are imported on first access (e.g. SGDPyUtil.logging_utils), not by 'import SGDPyUtil' """
+import importlib
+
+
+def __getattr__(name):
+    if not name.startswith("__"):
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
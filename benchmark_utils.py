@@ -0,0 +1,429 @@
+""" benchmarks for hot paths (headless: no dearpygui) """
+import os
+import gc
+import sys
+import time
+import inspect
+import threading
+import subprocess
+import tracemalloc
+
+from SGDPyUtil.logging_utils import Logger
+from SGDPyUtil.singleton_utils import SingletonInstance
+from SGDPyUtil.function_utils import FunctionObject, inspect_args
+from SGDPyUtil.timer_utils import (
+    TimerItem,
+    TimerContext,
+    TimerContextType,
+    TimerProfiler,
+    TimerSequenceItem,
+    SequenceItem,
+)
+
+
+def noop():
+    return
+
+
+def percentile(sorted_values: list, ratio: float):
+    if len(sorted_values) == 0:
+        return 0.0
+    return sorted_values[int((len(sorted_values) - 1) * ratio)]
+
+
+def create_timer_context(
+    context_type: TimerContextType, timer_count: int, due_count: int = 0
+) -> TimerContext:
+    """create context with timer_count timers, first due_count timers are executed on every tick"""
+    context = TimerContext(context_type)
+
+    for index in range(timer_count):
+        repeat_time = 0.0 if index < due_count else 3600.0
+        context.register_timer(
+            TimerItem(f"timer_{index}", repeat_time, FunctionObject(noop))
+        )
+
+    # flush pending timers
+    context.tick()
+
+    return context
+
+
+def benchmark_timer_context(
+    timer_counts=(10_000, 100_000, 1_000_000), tick_count=10, due_ratio=0.001
+) -> dict:
+    """
+    compare tick cost of TimerContextType.LINEAR and TimerContextType.HEAP
+    - due_ratio: ratio of timers to be executed on every tick (the others are never due)
+    - return {(context_type, timer_count): average tick time in seconds}
+    """
+    results = {}
+
+    for timer_count in timer_counts:
+        due_count = int(timer_count * due_ratio)
+
+        for context_type in (TimerContextType.LINEAR, TimerContextType.HEAP):
+            context = create_timer_context(context_type, timer_count, due_count)
+
+            # measure tick time
+            start_time = time.perf_counter()
+            for _ in range(tick_count):
+                context.tick()
+            tick_time = (time.perf_counter() - start_time) / tick_count
+
+            results[(context_type, timer_count)] = tick_time
+            Logger.instance().info(
+                f"[benchmark_timer_context] {context_type.name} timers[{timer_count}] due[{due_count}] tick[{tick_time * 1000.0:.3f}ms]"
+            )
+
+    return results
+
+
+def benchmark_timer_tick_latency(
+    context_type: TimerContextType,
+    timer_count: int,
+    tick_count=200,
+    due_ratio=0.01,
+) -> dict:
+    """tick latency percentiles in seconds: {p50, p90, p99, max}"""
+    context = create_timer_context(context_type, timer_count, int(timer_count * due_ratio))
+
+    latencies = []
+    for _ in range(tick_count):
+        start_time = time.perf_counter()
+        context.tick()
+        latencies.append(time.perf_counter() - start_time)
+    latencies.sort()
+
+    return {
+        "p50": percentile(latencies, 0.50),
+        "p90": percentile(latencies, 0.90),
+        "p99": percentile(latencies, 0.99),
+        "max": latencies[-1],
+    }
+
+
+def benchmark_timer_callback_throughput(
+    context_type: TimerContextType, timer_count: int, duration=1.0
+) -> float:
+    """executed timer functions per second when every timer is due on every tick"""
+    context = create_timer_context(context_type, timer_count, timer_count)
+
+    # both backends wait one tick before the first execution
+    context.tick()
+
+    counter = [0]
+
+    def count():
+        counter[0] += 1
+
+    for _, timer_item in context.timers.items():
+        timer_item.function = FunctionObject(count)
+
+    start_time = time.perf_counter()
+    while time.perf_counter() - start_time < duration:
+        context.tick()
+    elapsed_time = time.perf_counter() - start_time
+
+    return counter[0] / elapsed_time
+
+
+def benchmark_timer_registration_churn(
+    context_type: TimerContextType, timer_count: int, round_count=5
+) -> float:
+    """register + unregister (each processed by tick) per second"""
+    context = create_timer_context(context_type, timer_count)
+
+    start_time = time.perf_counter()
+    for round_index in range(round_count):
+        for index in range(timer_count):
+            context.register_timer(
+                TimerItem(f"churn_{round_index}_{index}", 3600.0, FunctionObject(noop))
+            )
+        context.tick()
+
+        for index in range(timer_count):
+            context.unregister_timer(f"churn_{round_index}_{index}")
+        context.tick()
+    elapsed_time = time.perf_counter() - start_time
+
+    return (timer_count * round_count) / elapsed_time
+
+
+def benchmark_timer_memory(context_type: TimerContextType, timer_count: int) -> float:
+    """bytes per registered timer (TimerItem + FunctionObject + context bookkeeping)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        context = create_timer_context(context_type, timer_count)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del context
+    return (after - before) / timer_count
+
+
+def benchmark_timer_sequence(item_count: int) -> float:
+    """TimerSequenceItem executions per second with once=True items (add, rotate, remove)"""
+    sequence = TimerSequenceItem("sequence", -1.0)
+    sequence.add_sequence_items(
+        [
+            SequenceItem(f"item_{index}", FunctionObject(noop), once=True)
+            for index in range(item_count)
+        ]
+    )
+
+    start_time = time.perf_counter()
+    for _ in range(item_count + 1):
+        sequence.tick(0.0)
+    elapsed_time = time.perf_counter() - start_time
+
+    return item_count / elapsed_time
+
+
+def benchmark_function_object(call_count=1_000_000) -> dict:
+    """calls per second of FunctionObject.call() compared with *args/**kwargs unpacking per call"""
+    results = {}
+
+    def add(a, b, c=0):
+        return a + b + c
+
+    def unpack_call(function, args, kwargs):
+        return lambda: function(*args, **kwargs)
+
+    cases = {
+        "no_args": (noop, (), {}),
+        "args": (add, (1, 2), {}),
+        "args_kwargs": (add, (1, 2), {"c": 3}),
+    }
+    for case_name, (function, args, kwargs) in cases.items():
+        for call_type in ("unpack", "function_object"):
+            if call_type == "unpack":
+                call = unpack_call(function, args, kwargs)
+            else:
+                call = FunctionObject(function, *args, **kwargs).call
+
+            start_time = time.perf_counter()
+            for _ in range(call_count):
+                call()
+            elapsed_time = time.perf_counter() - start_time
+
+            results[(case_name, call_type)] = call_count / elapsed_time
+            Logger.instance().info(
+                f"[benchmark_function_object] {case_name} {call_type} calls[{call_count / elapsed_time:.0f}/s]"
+            )
+
+    return results
+
+
+def benchmark_inspect_args(call_count=100_000) -> dict:
+    """calls per second of inspect_args compared with inspect.signature().bind() per call"""
+    results = {}
+
+    def add(a, b, c=0, *, d=1):
+        return a + b + c + d
+
+    def signature_bind(function, *args, **kwargs):
+        bound_args = inspect.signature(function).bind(*args, **kwargs)
+        bound_args.apply_defaults()
+        return bound_args.arguments
+
+    for call_type, bind in (("signature", signature_bind), ("inspect_args", inspect_args)):
+        start_time = time.perf_counter()
+        for _ in range(call_count):
+            bind(add, 1, 2, d=3)
+        elapsed_time = time.perf_counter() - start_time
+
+        results[call_type] = call_count / elapsed_time
+        Logger.instance().info(
+            f"[benchmark_inspect_args] {call_type} calls[{call_count / elapsed_time:.0f}/s]"
+        )
+
+    return results
+
+
+def benchmark_singleton_instance(thread_counts=(1, 4, 16), call_count=200_000) -> dict:
+    """
+    SingletonInstance.instance() under contention
+    - constructions: count of __init__ when thread_count threads race on the first instance() (must be 1)
+    - calls: instance() calls per second summed over threads, compared with acquiring a lock on every call
+    """
+    results = {}
+
+    for thread_count in thread_counts:
+
+        class BenchmarkSingleton(SingletonInstance):
+            construction_count = 0
+
+            def __init__(self):
+                # widen the race window of the first instance()
+                time.sleep(0.01)
+                BenchmarkSingleton.construction_count += 1
+
+        lock = threading.Lock()
+
+        def locked_instance():
+            with lock:
+                return BenchmarkSingleton.instance()
+
+        for call_type in ("first", "instance", "locked"):
+            barrier = threading.Barrier(thread_count + 1)
+
+            def run():
+                barrier.wait()
+                if call_type == "first":
+                    BenchmarkSingleton.instance()
+                    return
+                get_instance = (
+                    BenchmarkSingleton.instance if call_type == "instance" else locked_instance
+                )
+                for _ in range(call_count):
+                    get_instance()
+                return
+
+            threads = [threading.Thread(target=run) for _ in range(thread_count)]
+            for thread in threads:
+                thread.start()
+            barrier.wait()
+            start_time = time.perf_counter()
+            for thread in threads:
+                thread.join()
+            elapsed_time = time.perf_counter() - start_time
+
+            if call_type == "first":
+                results[(thread_count, "constructions")] = BenchmarkSingleton.construction_count
+                Logger.instance().info(
+                    f"[benchmark_singleton_instance] threads[{thread_count}] constructions[{BenchmarkSingleton.construction_count}]"
+                )
+            else:
+                calls = thread_count * call_count / elapsed_time
+                results[(thread_count, call_type)] = calls
+                Logger.instance().info(
+                    f"[benchmark_singleton_instance] threads[{thread_count}] {call_type} calls[{calls:.0f}/s]"
+                )
+
+    return results
+
+
+def profile_import_time(
+    module_names=(
+        "SGDPyUtil",
+        "SGDPyUtil.logging_utils",
+        "SGDPyUtil.timer_utils",
+        "SGDPyUtil.event_utils",
+        "SGDPyUtil.bootstrap_utils",
+    ),
+    top_count=10,
+    run_count=5,
+) -> dict:
+    """
+    cold import cost of modules, each measured in fresh interpreters
+    - wall: median wall time of 'python -c "import <module>"' in seconds (interpreter startup included)
+    - total_us: cumulative import time of the module reported by 'python -X importtime'
+    - top: [(module name, cumulative us, self us)] of the most expensive imports
+    """
+    results = {}
+
+    # directory containing SGDPyUtil package
+    environment = dict(os.environ)
+    package_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment["PYTHONPATH"] = os.pathsep.join(
+        [package_parent_dir] + [path for path in [environment.get("PYTHONPATH", "")] if path != ""]
+    )
+
+    for module_name in module_names:
+        command = [sys.executable, "-c", f"import {module_name}"]
+
+        wall_times = []
+        for _ in range(run_count):
+            start_time = time.perf_counter()
+            subprocess.run(command, env=environment, capture_output=True)
+            wall_times.append(time.perf_counter() - start_time)
+        wall_times.sort()
+
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime"] + command[1:],
+            env=environment,
+            capture_output=True,
+            text=True,
+        )
+
+        # import time: self [us] | cumulative | imported package
+        imports = []
+        for line in completed.stderr.splitlines():
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            self_us, cumulative_us, name = line[len("import time:") :].split("|")
+            imports.append((name.strip(), int(cumulative_us), int(self_us)))
+
+        total_us = 0
+        for name, cumulative_us, _ in imports:
+            if name == module_name:
+                total_us = cumulative_us
+        imports.sort(key=lambda item: item[1], reverse=True)
+
+        results[module_name] = {
+            "wall": percentile(wall_times, 0.5),
+            "total_us": total_us,
+            "top": imports[:top_count],
+        }
+        Logger.instance().info(
+            f"[profile_import_time] {module_name} wall[{percentile(wall_times, 0.5) * 1000.0:.1f}ms] import[{total_us / 1000.0:.1f}ms]"
+        )
+        for name, cumulative_us, self_us in imports[:top_count]:
+            Logger.instance().info(
+                f"[profile_import_time]     {name} cumulative[{cumulative_us / 1000.0:.1f}ms] self[{self_us / 1000.0:.1f}ms]"
+            )
+
+    return results
+
+
+def profile_timer_context(context: TimerContext, tick_count=100) -> TimerProfiler:
+    """tick context with TimerProfiler and log the timers spending most time"""
+    profiler = TimerProfiler()
+
+    context.set_profiler(profiler)
+    for _ in range(tick_count):
+        context.tick()
+    context.set_profiler(None)
+
+    profiler.log_report()
+    return profiler
+
+
+def run_timer_benchmark_suite(timer_counts=(1_000, 10_000, 100_000)) -> dict:
+    """run all timer benchmarks for both backends and log the results"""
+    results = {}
+
+    for timer_count in timer_counts:
+        for context_type in (TimerContextType.LINEAR, TimerContextType.HEAP):
+            latency = benchmark_timer_tick_latency(context_type, timer_count)
+            throughput = benchmark_timer_callback_throughput(context_type, timer_count)
+            churn = benchmark_timer_registration_churn(context_type, timer_count)
+            memory = benchmark_timer_memory(context_type, timer_count)
+
+            results[(context_type, timer_count)] = {
+                "tick_latency": latency,
+                "callback_throughput": throughput,
+                "registration_churn": churn,
+                "bytes_per_timer": memory,
+            }
+            Logger.instance().info(
+                f"[run_timer_benchmark_suite] {context_type.name} timers[{timer_count}] "
+                f"tick p50[{latency['p50'] * 1000.0:.3f}ms] p90[{latency['p90'] * 1000.0:.3f}ms] p99[{latency['p99'] * 1000.0:.3f}ms] max[{latency['max'] * 1000.0:.3f}ms] "
+                f"callbacks[{throughput:.0f}/s] churn[{churn:.0f}/s] memory[{memory:.0f}B/timer]"
+            )
+
+        sequence_rate = benchmark_timer_sequence(timer_count)
+        results[("sequence", timer_count)] = sequence_rate
+        Logger.instance().info(
+            f"[run_timer_benchmark_suite] TimerSequenceItem items[{timer_count}] executions[{sequence_rate:.0f}/s]"
+        )
+
+    return results
+
+
+if __name__ == "__main__":
+    run_timer_benchmark_suite()
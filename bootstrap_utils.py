@@ -1,4 +1,3 @@
-from distutils.util import execute
 import os
 import platform
 import shutil
@@ -16,6 +15,7 @@ from SGDPyUtil.powershell_utils import execute_command
 from SGDPyUtil.visual_studio_utils import *
 from SGDPyUtil.main import *
 from SGDPyUtil.json_utils import *
+from SGDPyUtil.import_utils import lazy_import, is_module_available
 
 try:
     from urllib.request import urlparse
@@ -29,16 +29,11 @@ except ImportError:
     from urllib import URLopener
     from urllib import quote
 
-try:
-    import paramiko
-    import scp
-
-    scp_available = True
-except:
-    scp_available = False
-    Logger.instance().info(
-        f"[WARNING] please install the Python packages [paramiko, scp] for full script operation"
-    )
+# paramiko is heavy to import: imported on the first download_scp()
+scp_available = is_module_available("paramiko") and is_module_available("scp")
+if scp_available:
+    paramiko = lazy_import("paramiko")
+    scp = lazy_import("scp")
 
 
 class BootstrapGlobal(SingletonInstance):
@@ -588,6 +583,12 @@ def bootstrap_main(cwd: str, argv):
     # setup BootstrapGlobal
     BootstrapGlobal.instance().setup(cwd)
 
+    # warn on entry instead of at import time (Logger is not constructed by importing this module)
+    if not scp_available:
+        Logger.instance().info(
+            f"[WARNING] please install the Python packages [paramiko, scp] for full script operation"
+        )
+
     # get cmd options with getopt
     try:
         opts, args = getopt.getopt(
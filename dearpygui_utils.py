@@ -6,7 +6,7 @@ import dearpygui.dearpygui as dpg
 from SGDPyUtil.singleton_utils import SingletonInstance
 from SGDPyUtil.logging_utils import Logger
 from SGDPyUtil.function_utils import FunctionObject
-from SGDPyUtil.event_utils import EventTask, SyncEventTaskQueue
+from SGDPyUtil.event_utils import EventTask, SyncEventTaskQueue, EventDispatchType
 from SGDPyUtil.timer_utils import *
 
 
@@ -26,6 +26,9 @@ class DearPyGuiContext(SingletonInstance):
 
         # used for create primary window
         self.primary_window_setup: DearPyGuiDelegate = None
+
+        # how DearPyGuiApp's task queue executes tasks (set before DearPyGuiApp is created)
+        self.task_dispatch_type: EventDispatchType = EventDispatchType.SERIAL
         return
 
 
@@ -36,7 +39,13 @@ class DearPyGuiApp(SingletonInstance):
         self.primary_window_tag = None
 
         # task queue
-        self.task_queue: SyncEventTaskQueue = SyncEventTaskQueue()
+        self.task_queue: SyncEventTaskQueue = SyncEventTaskQueue(
+            DearPyGuiContext.instance().task_dispatch_type
+        )
+
+        # tasks are dispatched up to task_time_budget per tick to keep target_fps
+        self.target_fps = 60
+        self.task_time_budget = 0.5 / self.target_fps
 
         # timer manager
         self.timer_manager: TimerContext = TimerContext()
@@ -79,15 +88,8 @@ class DearPyGuiApp(SingletonInstance):
         self.timer_manager.tick()
 
         """event task queue"""
-        # dispatch tasks
-        can_continue = True
-        while can_continue:
-            can_continue = self.task_queue.try_dispatch_once()
-
-        # any remaining task?
-        is_all_tasks_processed = (
-            self.task_queue.is_empty() and not self.task_queue.is_pending()
-        )
+        # dispatch tasks within time budget, any remaining task?
+        is_all_tasks_processed = self.task_queue.dispatch(self.task_time_budget)
 
         """dearpygui"""
         # render dearpygui_frame
@@ -98,10 +100,17 @@ class DearPyGuiApp(SingletonInstance):
     def add_task(self, task: EventTask):
         self.task_queue.add_task(task)
 
+    def add_tasks(self, tasks: list):
+        self.task_queue.add_tasks(tasks)
+
     def signal_tag(self, tag=""):
         self.task_queue.signal_sync_barrier(tag)
 
     def destroy_app(self):
+        # stop timer and task worker pools
+        self.timer_manager.shutdown(wait=False)
+        self.task_queue.shutdown(wait=False)
+
         dpg.destroy_context()
 
 
@@ -1,57 +1,333 @@
 """ event queue """
-from queue import Queue
-from threading import Event
+import time
+import heapq
+import itertools
+import traceback
+from enum import Enum
+from threading import Lock
+from collections import deque
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    Future,
+    TimeoutError,
+    wait,
+    FIRST_COMPLETED,
+)
 
 # logging
 from SGDPyUtil.logging_utils import Logger
 
 # function
-from SGDPyUtil.function_utils import FunctionObject
+from SGDPyUtil.function_utils import FunctionObject, FunctionFuture
+
+# metrics
+from SGDPyUtil.metrics_utils import LatencyHistogram
 
 
 class EventCommand:
-    """event command"""
+    """
+    event command
+    - result_future is resolved with the return value (or exception) of the next execution of execute_function:
+      chain with result_future.then() before the command is dispatched, instead of polling shared state
+    - each execution gets its own future: executing the command again replaces the completed result_future
+    - cancelling result_future before execution skips execute_function once (callback is still called)
+    """
 
     def __init__(
-        self, execute_function: FunctionObject, callback_function: FunctionObject = None
+        self,
+        execute_function: FunctionObject,
+        callback_function: FunctionObject = None,
+        use_process: bool = False,
     ):
         # capture function and its arguments
         self.task_execute = execute_function
         self.task_callback = callback_function
+
+        # commands (in same EventTask) to be finished before this command
+        self.dependencies: list["EventCommand"] = []
+
+        # execute in process pool (CPU-heavy command)
+        # - function, arguments and return value are marshalled by pickle: use module-level function
+        # - callback is still called on the dispatching thread
+        self.use_process = use_process
+        self.future: Future = None
+
+        # return value of execute_function
+        self.result_future = FunctionFuture()
+        self.result = None
         return
 
-    def execute(self):
-        self.task_execute.call()
+    def depends_on(self, *commands: "EventCommand") -> "EventCommand":
+        self.dependencies.extend(commands)
+        return self
+
+    def then(self, function, executor: ThreadPoolExecutor = None) -> FunctionFuture:
+        """chain function(result) to the command's return value"""
+        return self.result_future.then(function, executor)
+
+    def cancel(self) -> bool:
+        """skip execution, False when the command is already executed"""
+        return self.result_future.cancel()
+
+    def execute(self, process_executor: "ProcessPoolExecutor" = None) -> FunctionFuture:
+        self.future = None
+
+        result_future = self.result_future
+        if result_future.cancelled():
+            # skip this execution, the next execution gets a new future
+            self.result_future = FunctionFuture()
+            return result_future
+        if result_future.done() or result_future.running():
+            # executed again (e.g. re-added in a new EventTask)
+            result_future = self.result_future = FunctionFuture()
+
+        if self.use_process and process_executor != None:
+            # submit and return, callback() receives the result
+            self.future = process_executor.submit(
+                self.task_execute.function,
+                *self.task_execute.args,
+                **self.task_execute.kwargs,
+            )
+            self.future.add_done_callback(result_future.resolve)
+            return result_future
+
+        self.task_execute.invoke(result_future)
+        if not result_future.done():
+            # function returned future (flattened): do not block the executing thread
+            result_future.add_done_callback(self.store_result)
+        elif not result_future.cancelled():
+            # re-raise the exception on the executing thread
+            self.result = result_future.result()
+        return result_future
+
+    def store_result(self, future: Future):
+        if not future.cancelled() and future.exception() == None:
+            self.result = future.result()
         return
 
+    def execute_and_wait(self, process_executor: "ProcessPoolExecutor" = None):
+        """execute and wait for the process pool (re-raise the exception in the process)"""
+        self.execute(process_executor)
+        if self.future != None:
+            self.result = self.future.result()
+        return self.result
+
+    def is_executing(self) -> bool:
+        return self.future != None and not self.future.done()
+
     def callback(self):
+        # result of process pool
+        if self.future != None:
+            if self.future.exception() != None:
+                Logger.instance().info(
+                    f"[ERROR][EventCommand] process command raised exception: {''.join(traceback.format_exception(self.future.exception()))}"
+                )
+                return
+            self.result = self.future.result()
+
         if self.task_callback != None:
             self.task_callback.call()
         return
 
 
+class EventGraphErrorException(Exception):
+    pass
+
+
 class EventTask:
-    def __init__(self, event_tag=""):
+    def __init__(self, event_tag="", priority=0, deadline: float = None, label=""):
         # event tag using EventTaskQueue
         self.event_tag = event_tag
+        # name used to aggregate instrumentation (EventTaskInstrumentation)
+        self.label = label
         # commands (batched command)
         self.commands: list["EventCommand"] = []
+
+        # higher priority is dispatched first (e.g. interactive click over heavy work)
+        self.priority = priority
+        # time.monotonic() after which the task is not worth executing (None: no deadline)
+        self.deadline = deadline
+        # time.monotonic() when the task is added to queue
+        self.enqueue_time: float = None
+        # time.monotonic() when execute() is finished
+        self.execute_end_time: float = None
+
+        # tasks to be finished (callback called) before this task is executed
+        self.dependencies: list["EventTask"] = []
+        # tasks waiting for this task, and number of unfinished dependencies (managed by SyncEventTaskQueue)
+        self.dependents: list["EventTask"] = []
+        self.blocking_count = 0
+        self.finished = False
+        # dropped without execution (expired, or its dependency is dropped)
+        self.dropped = False
+
+        # command callbacks already called while executing command graph
+        self.called_back_commands: set = set()
+        # commands finished in command graph executed on worker thread, callbacks are called by the dispatching thread
+        self.completed_commands: deque = deque()
         return
 
+    def depends_on(self, *tasks: "EventTask") -> "EventTask":
+        """dependencies are added to the queue before (or together with) this task"""
+        self.dependencies.extend(tasks)
+        return self
+
+    def has_command_graph(self) -> bool:
+        for command in self.commands:
+            if len(command.dependencies) > 0:
+                return True
+        return False
+
     def is_sync_task(self) -> bool:
         return self.event_tag != ""
 
+    def is_expired(self, now: float) -> bool:
+        return self.deadline != None and self.deadline < now
+
+    def get_label(self) -> str:
+        if self.label != "":
+            return self.label
+        if self.event_tag != "":
+            return self.event_tag
+
+        # name of the first command's function
+        if len(self.commands) > 0:
+            function = self.commands[0].task_execute.function
+            return getattr(function, "__qualname__", type(function).__name__)
+
+        return "EventTask"
+
     def add_command(self, command: EventCommand):
         self.commands.append(command)
         return
 
-    def execute(self):
+    def execute(
+        self,
+        executor: ThreadPoolExecutor = None,
+        process_executor: "ProcessPoolExecutor" = None,
+        defer_callbacks: bool = False,
+    ):
+        # commands without dependencies are executed serially in order
+        # - process commands are submitted and run concurrently with the following commands
+        if not self.has_command_graph():
+            for command in self.commands:
+                command.execute(process_executor)
+            return
+
+        self.execute_graph(executor, process_executor, defer_callbacks)
+        return
+
+    def is_executing(self) -> bool:
+        """whether any process command is still running"""
         for command in self.commands:
-            command.execute()
+            if command.is_executing():
+                return True
+        return False
+
+    def wait_process_commands(self):
+        for command in self.commands:
+            if command.future != None:
+                wait((command.future,))
+        return
+
+    def execute_graph(
+        self,
+        executor: ThreadPoolExecutor = None,
+        process_executor: "ProcessPoolExecutor" = None,
+        defer_callbacks: bool = False,
+    ):
+        """
+        execute commands as DAG: a command is executed when all its dependencies are finished
+        - with executor, ready commands are executed in parallel
+        - command's callback is called as soon as the command is finished (not for sync task, it waits for signal)
+        - defer_callbacks: finished commands are queued to completed_commands instead,
+          the dispatching thread calls their callbacks with callback_completed_commands()
+        - when a command raises exception, its dependents are not executed and the exception is re-raised
+        """
+        # build graph
+        remain_counts: dict[EventCommand, int] = {}
+        dependents: dict[EventCommand, list] = {command: [] for command in self.commands}
+        for command in self.commands:
+            remain_counts[command] = len(command.dependencies)
+            for dependency in command.dependencies:
+                if not dependency in dependents:
+                    raise EventGraphErrorException(
+                        f"command depends on a command outside of the task [{self.event_tag}]"
+                    )
+                dependents[dependency].append(command)
+
+        ready_commands = deque(
+            [command for command in self.commands if remain_counts[command] == 0]
+        )
+        finished_count = 0
+        error = None
+
+        def on_finished(command: EventCommand):
+            if not self.is_sync_task():
+                if defer_callbacks:
+                    self.completed_commands.append(command)
+                else:
+                    command.callback()
+                    self.called_back_commands.add(command)
+
+            for dependent in dependents[command]:
+                remain_counts[dependent] -= 1
+                if remain_counts[dependent] == 0:
+                    ready_commands.append(dependent)
+            return
+
+        if executor == None:
+            while len(ready_commands) > 0:
+                command = ready_commands.popleft()
+                command.execute_and_wait(process_executor)
+                on_finished(command)
+                finished_count += 1
+        else:
+            running_futures: dict[Future, EventCommand] = {}
+            while len(ready_commands) > 0 or len(running_futures) > 0:
+                # stop scheduling new commands after failure
+                while len(ready_commands) > 0 and error == None:
+                    command = ready_commands.popleft()
+                    future = executor.submit(command.execute_and_wait, process_executor)
+                    running_futures[future] = command
+
+                if len(running_futures) == 0:
+                    break
+
+                done_futures, _ = wait(running_futures.keys(), return_when=FIRST_COMPLETED)
+                for future in done_futures:
+                    command = running_futures.pop(future)
+                    if future.exception() != None:
+                        error = future.exception() if error == None else error
+                        continue
+                    on_finished(command)
+                    finished_count += 1
+
+        if error != None:
+            raise error
+
+        if finished_count != len(self.commands):
+            raise EventGraphErrorException(
+                f"cyclic command dependencies in task [{self.event_tag}]"
+            )
+
+        return
+
+    def callback_completed_commands(self):
+        """call callbacks of commands finished in command graph so far (on the dispatching thread)"""
+        while len(self.completed_commands) > 0:
+            command = self.completed_commands.popleft()
+            command.callback()
+            self.called_back_commands.add(command)
         return
 
     def callback(self):
+        self.callback_completed_commands()
+
         for command in self.commands:
+            # already called while executing command graph
+            if command in self.called_back_commands:
+                continue
             command.callback()
         return
 
@@ -60,121 +336,777 @@ class SyncErrorException(Exception):
     pass
 
 
+class SyncEventTag:
+    """per-tag state of SyncEvent: waiters and signals arrived before any waiter"""
+
+    def __init__(self):
+        self.waiters: deque = deque()
+        self.signal_count = 0
+
+
 class SyncEvent:
+    """
+    barrier between wait() and signal() matched by tag
+    - each wait is a Future completed directly by signal(): no polling, O(1) matching per tag
+    - many tags could be outstanding at the same time
+    - signal() before wait() is kept, the next wait() for the tag returns immediately
+    """
+
     def __init__(self):
-        # create sync event
-        self._event = Event()
+        self.lock = Lock()
 
-        # tag information to check matching between wait() and signal()
+        # tag: SyncEventTag
+        self.tags: dict[str, SyncEventTag] = {}
+
+        # futures of wait() which timed out, reused by the next wait() for the tag
+        self.wait_futures: dict[str, Future] = {}
+
+        # last tag passed to wait()
         self.tag = ""
-        # signals
-        self.signal_tags: Queue[str] = Queue()
 
         return
 
-    def wait(self, tag="", time_out=None):
+    def acquire(self, tag="") -> Future:
+        """future to be completed when signal(tag) is called"""
+        future = Future()
+        with self.lock:
+            sync_tag = self.tags.get(tag, None)
+            if sync_tag == None:
+                sync_tag = SyncEventTag()
+                self.tags[tag] = sync_tag
+
+            if sync_tag.signal_count > 0:
+                # signal is already arrived
+                sync_tag.signal_count -= 1
+                if sync_tag.signal_count == 0 and len(sync_tag.waiters) == 0:
+                    self.tags.pop(tag)
+                future.set_result(tag)
+            else:
+                sync_tag.waiters.append(future)
+        return future
+
+    def wait(self, tag="", time_out=None) -> bool:
         # mark tag
         self.tag = tag
 
+        # continue the wait which timed out before
+        future = self.wait_futures.pop(tag, None)
+        if future == None:
+            future = self.acquire(tag)
+
         # wait for signal
-        result = self._event.wait(time_out)
+        if not future.done():
+            try:
+                future.result(time_out)
+            except TimeoutError:
+                self.wait_futures[tag] = future
+                return False
 
-        # validate
-        if result:
-            self.validate()
-            # reset the event
-            self._event.clear()
+        return True
 
-        return result
+    async def wait_async(self, tag=""):
+        """awaitable form of wait()"""
+        import asyncio
 
-    def validate(self):
-        signal_tag = self.signal_tags.get()
-        if not self.signal_tags.empty():
-            Logger.instance().info(f"[SyncEvent] multiple signal called [{signal_tag}]")
+        # cancelled wait (e.g. asyncio.wait_for timed out) cancels the future: stop waiting for the signal
+        future = self.acquire(tag)
+        future.add_done_callback(
+            lambda future: self.release(tag, future) if future.cancelled() else None
+        )
+        await asyncio.wrap_future(future)
+        return
 
-            count = 0
-            while not self.signal_tags.empty():
-                error_signal_tag = self.signal_tags.get()
-                Logger.instance().info(f"[SyncEvent]---[{count}] {error_signal_tag}")
-                count = count + 1
+    def release(self, tag: str, future: Future):
+        """remove future of acquire() from the waiters of the tag"""
+        with self.lock:
+            sync_tag = self.tags.get(tag, None)
+            if sync_tag == None or not future in sync_tag.waiters:
+                return
 
-            raise SyncErrorException
+            sync_tag.waiters.remove(future)
+            if sync_tag.signal_count == 0 and len(sync_tag.waiters) == 0:
+                self.tags.pop(tag)
+        return
 
-        if self.tag != signal_tag:
-            Logger.instance().info(
-                f"[SyncEvent] tag is mismatch [{self.tag}] and [{signal_tag}]"
-            )
-            raise SyncErrorException
+    def signal(self, tag=""):
+        with self.lock:
+            sync_tag = self.tags.get(tag, None)
+            if sync_tag == None:
+                sync_tag = SyncEventTag()
+                self.tags[tag] = sync_tag
+
+            # skip cancelled waiters, the others could not be cancelled once running
+            future = None
+            while len(sync_tag.waiters) > 0:
+                future = sync_tag.waiters.popleft()
+                if future.set_running_or_notify_cancel():
+                    break
+                future = None
+
+            if future == None:
+                # no one is waiting, keep the signal for the next wait
+                sync_tag.signal_count += 1
+                if sync_tag.signal_count > 1:
+                    Logger.instance().info(
+                        "[SyncEvent] multiple signal called [%s] count[%d]",
+                        tag,
+                        sync_tag.signal_count,
+                    )
+                return
+
+            if sync_tag.signal_count == 0 and len(sync_tag.waiters) == 0:
+                self.tags.pop(tag)
 
+        # notify waiter directly (done callbacks are called here)
+        future.set_result(tag)
         return
 
-    def signal(self, tag=""):
-        # add tag
-        self.signal_tags.put(tag)
-        # signal event
-        self._event.set()
 
+class EventQueueMetrics:
+    """queue depth and wait time (from add_task to dispatch) of EventTaskReadyQueue"""
 
-class SyncEventTaskQueue:
     def __init__(self):
+        self.depth: int = 0
+        self.max_depth: int = 0
+
+        self.enqueued_count: int = 0
+        self.dispatched_count: int = 0
+        self.dropped_count: int = 0
+
+        # seconds
+        self.total_wait_time: float = 0.0
+        self.max_wait_time: float = 0.0
+        return
+
+    def average_wait_time(self) -> float:
+        if self.dispatched_count == 0:
+            return 0.0
+        return self.total_wait_time / self.dispatched_count
+
+
+class EventTaskReadyQueue:
+    """
+    heap-based ready queue ordered by priority with aging (put/get/empty like queue.Queue, thread-safe)
+    - rank = enqueue_time - priority * aging_time: one priority level is worth aging_time seconds of waiting,
+      so a low priority task is dispatched once it waited long enough (no starvation)
+    - expired tasks (EventTask.deadline) are dropped before dispatch when drop_expired is set
+    - drop_listener(task) is called for each dropped task, under the queue lock (must not put tasks)
+    """
+
+    def __init__(self, aging_time: float = 1.0, drop_expired: bool = True):
+        self.aging_time = aging_time
+        self.drop_expired = drop_expired
+
+        # (rank, sequence, task): sequence keeps FIFO order for same rank
+        self.heap: list[tuple[float, int, EventTask]] = []
+        self.sequence = itertools.count()
+        self.lock = Lock()
+
+        self.metrics = EventQueueMetrics()
+        self.drop_listener = None
+        return
+
+    def empty(self) -> bool:
+        return len(self.heap) == 0
+
+    def qsize(self) -> int:
+        return len(self.heap)
+
+    def put(self, task: EventTask):
+        self.put_many((task,))
+        return
+
+    def put_many(self, tasks):
+        """put tasks in single lock acquisition"""
+        with self.lock:
+            now = time.monotonic()
+            for task in tasks:
+                task.enqueue_time = now
+                rank = now - task.priority * self.aging_time
+                heapq.heappush(self.heap, (rank, next(self.sequence), task))
+                self.metrics.enqueued_count += 1
+
+            self.metrics.depth = len(self.heap)
+            self.metrics.max_depth = max(self.metrics.max_depth, self.metrics.depth)
+        return
+
+    def get(self) -> EventTask:
+        """pop the task to dispatch, None if queue is empty (non-blocking)"""
+        tasks = self.drain(1)
+        return tasks[0] if len(tasks) > 0 else None
+
+    def drain(self, max_count: int = None) -> list:
+        """pop up to max_count tasks (None: all) to dispatch in priority order, in single lock acquisition"""
+        tasks = []
+        with self.lock:
+            now = time.monotonic()
+            while len(self.heap) > 0:
+                if max_count != None and len(tasks) >= max_count:
+                    break
+
+                _, _, task = heapq.heappop(self.heap)
+
+                if self.drop_expired and task.is_expired(now):
+                    self.on_dropped(task)
+                    continue
+
+                wait_time = now - task.enqueue_time
+                self.metrics.dispatched_count += 1
+                self.metrics.total_wait_time += wait_time
+                self.metrics.max_wait_time = max(self.metrics.max_wait_time, wait_time)
+                tasks.append(task)
+
+            self.metrics.depth = len(self.heap)
+        return tasks
+
+    def drop_expired_tasks(self) -> int:
+        """drop every expired task in the queue, return the number of dropped tasks"""
+        with self.lock:
+            now = time.monotonic()
+            alive_entries = []
+            for entry in self.heap:
+                if entry[2].is_expired(now):
+                    self.on_dropped(entry[2])
+                else:
+                    alive_entries.append(entry)
+
+            dropped_count = len(self.heap) - len(alive_entries)
+            if dropped_count > 0:
+                heapq.heapify(alive_entries)
+                self.heap = alive_entries
+                self.metrics.depth = len(self.heap)
+        return dropped_count
+
+    def on_dropped(self, task: EventTask):
+        task.dropped = True
+        self.metrics.dropped_count += 1
+        Logger.instance().info(
+            "[SyncEventTaskQueue] drop expired task [%s] priority[%d]",
+            task.event_tag,
+            task.priority,
+        )
+        if self.drop_listener != None:
+            self.drop_listener(task)
+        return
+
+
+class EventTaskInstrumentation:
+    """
+    latency histograms per task label (EventTask.get_label), in nanoseconds
+    - queue: from add_task to start of execute
+    - execute: time spent in execute
+    - barrier: from end of execute to signal observed (sync task only)
+    - callback: time spent in callback
+    """
+
+    kinds = ["queue", "execute", "barrier", "callback"]
+
+    def __init__(self, dump_interval: float = 60.0):
+        # label: {kind: LatencyHistogram}
+        self.histograms: dict[str, dict[str, LatencyHistogram]] = {}
+        self.lock = Lock()
+
+        # seconds between periodic dumps through Logger (None: no periodic dump)
+        self.dump_interval = dump_interval
+        self.last_dump_time = time.monotonic()
+        return
+
+    def record(self, label: str, kind: str, seconds: float):
+        histograms = self.histograms.get(label, None)
+        if histograms == None:
+            with self.lock:
+                histograms = self.histograms.setdefault(
+                    label, {kind: LatencyHistogram() for kind in self.kinds}
+                )
+        histograms[kind].record(seconds * 1_000_000_000)
+        return
+
+    def snapshot(self) -> dict:
+        """{label: {kind: histogram snapshot}}"""
+        with self.lock:
+            labels = list(self.histograms.items())
+
+        return {
+            label: {
+                kind: histogram.snapshot()
+                for kind, histogram in histograms.items()
+                if histogram.count > 0
+            }
+            for label, histograms in labels
+        }
+
+    def reset(self):
+        with self.lock:
+            self.histograms.clear()
+        return
+
+    def dump(self):
+        for label, kinds in self.snapshot().items():
+            for kind, snapshot in kinds.items():
+                Logger.instance().info(
+                    f"[EventTaskInstrumentation] [{label}][{kind}] count[{snapshot['count']}] "
+                    f"p50[{snapshot['p50'] / 1000:.1f}us] p90[{snapshot['p90'] / 1000:.1f}us] "
+                    f"p99[{snapshot['p99'] / 1000:.1f}us] max[{snapshot['max'] / 1000:.1f}us]"
+                )
+        return
+
+    def try_dump(self):
+        """dump when dump_interval is passed since last dump"""
+        if self.dump_interval == None:
+            return
+
+        now = time.monotonic()
+        if now - self.last_dump_time < self.dump_interval:
+            return
+        self.last_dump_time = now
+
+        self.dump()
+        return
+
+
+class EventDispatchType(Enum):
+    """how SyncEventTaskQueue executes tasks"""
+
+    # execute one task at a time on the caller's thread
+    SERIAL = 0
+    # execute tasks concurrently in worker pool, only tasks sharing event_tag are serialized
+    # - callbacks are still called on the caller's thread of try_dispatch_once()
+    POOL = 1
+
+
+class SyncEventTaskQueue:
+    def __init__(
+        self,
+        dispatch_type: EventDispatchType = EventDispatchType.SERIAL,
+        max_workers: int = 4,
+        max_process_workers: int = None,
+        aging_time: float = 1.0,
+        drop_expired: bool = True,
+        drain_count: int = 32,
+    ):
+        self.dispatch_type = dispatch_type
+
         # create sync event
         self.sync_barrier = SyncEvent()
 
-        # event tasks
-        self.tasks: Queue["EventTask"] = Queue()
+        # event tasks ordered by priority
+        self.tasks: EventTaskReadyQueue = EventTaskReadyQueue(aging_time, drop_expired)
+        # tasks deferred on an expired task are never ready
+        self.tasks.drop_listener = self.drop_dependents
+
+        # EventDispatchType.POOL pops up to drain_count tasks per lock acquisition
+        # - popped tasks are submitted in the same call: priority and deadline are checked at dispatch time
+        self.drain_count = drain_count
 
         # current running task
         self.curr_task: EventTask = None
 
+        # number of tasks waiting for their dependencies (EventTask.depends_on)
+        self.deferred_count = 0
+        # worker pool executing command graph (EventCommand.depends_on) in parallel
+        self.graph_executor: ThreadPoolExecutor = None
+
+        # per-task latency histograms (enable_instrumentation)
+        self.instrumentation: EventTaskInstrumentation = None
+
+        # process pool for EventCommand(use_process=True), None workers: number of CPUs
+        self.max_process_workers = max_process_workers
+        self.process_executor: "ProcessPoolExecutor" = None
+
+        # EventDispatchType.POOL
+        # - worker pool (created on demand)
+        self.max_workers = max_workers
+        self.executor: ThreadPoolExecutor = None
+        # - tasks executing in worker pool
+        self.running_tasks: list[tuple[EventTask, Future]] = []
+        # - executed sync tasks waiting for signal (event_tag: task)
+        self.waiting_tasks: dict[str, EventTask] = {}
+        # - event_tags whose signal arrived (appended by the signaling thread through Future's callback)
+        self.signaled_tags: deque = deque()
+        # - event_tags owned by running or waiting task, and tasks waiting for the tag to be released
+        self.busy_tags: set[str] = set()
+        self.blocked_tasks: dict[str, deque] = {}
+
         return
 
     def is_empty(self):
         return self.tasks.empty()
 
     def is_pending(self):
+        if self.deferred_count > 0:
+            return True
+        if self.dispatch_type == EventDispatchType.POOL:
+            return (
+                len(self.running_tasks) > 0
+                or len(self.waiting_tasks) > 0
+                or len(self.blocked_tasks) > 0
+            )
         return self.curr_task != None
 
     def signal_sync_barrier(self, tag):
+        # signals could be called from any thread and before the task finishes its execution
         self.sync_barrier.signal(tag)
         return
 
+    def get_metrics(self) -> EventQueueMetrics:
+        return self.tasks.metrics
+
+    def enable_instrumentation(self, dump_interval: float = 60.0) -> EventTaskInstrumentation:
+        if self.instrumentation == None:
+            self.instrumentation = EventTaskInstrumentation(dump_interval)
+        return self.instrumentation
+
+    def disable_instrumentation(self):
+        self.instrumentation = None
+        return
+
+    def get_instrumentation_snapshot(self) -> dict:
+        if self.instrumentation == None:
+            return {}
+        return self.instrumentation.snapshot()
+
+    def drop_expired_tasks(self) -> int:
+        return self.tasks.drop_expired_tasks()
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        if self.executor == None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="SyncEventTaskQueue"
+            )
+        return self.executor
+
+    def get_graph_executor(self) -> ThreadPoolExecutor:
+        # separated from self.executor: a task running in self.executor waits for its commands
+        if self.graph_executor == None:
+            self.graph_executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="EventTaskGraph"
+            )
+        return self.graph_executor
+
+    def get_process_executor(self) -> "ProcessPoolExecutor":
+        if self.process_executor == None:
+            # imported on demand: concurrent.futures.process imports multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            self.process_executor = ProcessPoolExecutor(
+                max_workers=self.max_process_workers
+            )
+        return self.process_executor
+
+    def shutdown(self, wait=True):
+        """shutdown worker pool"""
+        if self.executor != None:
+            self.executor.shutdown(wait=wait)
+            self.executor = None
+        if self.graph_executor != None:
+            self.graph_executor.shutdown(wait=wait)
+            self.graph_executor = None
+        if self.process_executor != None:
+            self.process_executor.shutdown(wait=wait)
+            self.process_executor = None
+        return
+
+    def has_process_command(self, task: EventTask) -> bool:
+        for command in task.commands:
+            if command.use_process:
+                return True
+        return False
+
+    def execute_task(
+        self,
+        task: EventTask,
+        wait_process_commands: bool = False,
+        defer_callbacks: bool = False,
+    ):
+        instrumentation = self.instrumentation
+        start_time = time.monotonic()
+
+        process_executor = None
+        if self.has_process_command(task):
+            process_executor = self.get_process_executor()
+
+        if task.has_command_graph():
+            task.execute(self.get_graph_executor(), process_executor, defer_callbacks)
+        else:
+            task.execute(None, process_executor)
+
+        # worker thread could wait for process commands, dispatching thread polls task.is_executing()
+        if wait_process_commands:
+            task.wait_process_commands()
+
+        task.execute_end_time = time.monotonic()
+        if instrumentation != None:
+            label = task.get_label()
+            instrumentation.record(label, "queue", start_time - task.enqueue_time)
+            instrumentation.record(label, "execute", task.execute_end_time - start_time)
+        return
+
+    def callback_task(self, task: EventTask):
+        """call callback and mark task is finished"""
+        instrumentation = self.instrumentation
+        start_time = time.monotonic()
+
+        task.callback()
+
+        if instrumentation != None:
+            label = task.get_label()
+            if task.is_sync_task():
+                instrumentation.record(
+                    label, "barrier", start_time - task.execute_end_time
+                )
+            instrumentation.record(label, "callback", time.monotonic() - start_time)
+
+        self.finish_task(task)
+        return
+
+    def defer_task(self, task: EventTask) -> bool:
+        """
+        defer task until its dependencies finish (it is added to queue again by finish_task())
+        - return whether task is not ready (deferred or dropped)
+        - task is dropped when a dependency is dropped or was never added to the queue
+        """
+        for dependency in task.dependencies:
+            if dependency.dropped:
+                self.drop_task(task, "its dependency is dropped")
+                return True
+            if not dependency.finished and dependency.enqueue_time == None:
+                self.drop_task(task, "its dependency is not added to the queue")
+                return True
+
+        for dependency in task.dependencies:
+            if not dependency.finished:
+                dependency.dependents.append(task)
+                task.blocking_count += 1
+        if task.blocking_count > 0:
+            self.deferred_count += 1
+            return True
+        return False
+
+    def get_ready_task(self) -> EventTask:
+        """pop the task whose dependencies are finished, the others are deferred until dependencies finish"""
+        while True:
+            task = self.tasks.get()
+            if task == None:
+                return None
+            if not self.defer_task(task):
+                return task
+
+    def drop_task(self, task: EventTask, reason: str):
+        """drop task without execution, its deferred dependents are dropped too"""
+        task.dropped = True
+        self.tasks.metrics.dropped_count += 1
+        Logger.instance().info(
+            "[SyncEventTaskQueue] drop task [%s]: %s", task.get_label(), reason
+        )
+        self.drop_dependents(task)
+        return
+
+    def drop_dependents(self, task: EventTask):
+        dependents = task.dependents
+        task.dependents = []
+        for dependent in dependents:
+            # already dropped through another dependency
+            if dependent.dropped:
+                continue
+            # dependent is deferred (not in the queue)
+            self.deferred_count -= 1
+            self.drop_task(dependent, "its dependency is dropped")
+        return
+
+    def finish_task(self, task: EventTask):
+        task.finished = True
+
+        # dependents whose dependencies are all finished become ready
+        for dependent in task.dependents:
+            # dropped through another dependency
+            if dependent.dropped:
+                continue
+            dependent.blocking_count -= 1
+            if dependent.blocking_count == 0:
+                self.deferred_count -= 1
+                self.tasks.put(dependent)
+        task.dependents.clear()
+        return
+
+    def check_dependencies(self, task: EventTask):
+        """raise EventGraphErrorException when task depends on itself (directly or indirectly)"""
+        if len(task.dependencies) == 0:
+            return
+
+        visited = set()
+        dependencies = list(task.dependencies)
+        while len(dependencies) > 0:
+            dependency = dependencies.pop()
+            if dependency is task:
+                raise EventGraphErrorException(
+                    f"cyclic task dependencies in task [{task.get_label()}]"
+                )
+            if dependency.finished or dependency in visited:
+                continue
+            visited.add(dependency)
+            dependencies.extend(dependency.dependencies)
+        return
+
     def add_task(self, task: EventTask):
+        self.check_dependencies(task)
         self.tasks.put(task)
         return
 
+    def add_tasks(self, tasks: list):
+        """add many tasks in single lock acquisition"""
+        for task in tasks:
+            self.check_dependencies(task)
+        self.tasks.put_many(tasks)
+        return
+
+    def dispatch(self, time_budget: float = None) -> bool:
+        """
+        dispatch tasks until no task is available or time_budget (seconds) is spent
+        - return whether every task is processed
+        """
+        start_time = time.perf_counter()
+
+        can_continue = True
+        while can_continue:
+            can_continue = self.try_dispatch_once()
+
+            # leave remaining tasks to next call
+            if time_budget != None and time.perf_counter() - start_time >= time_budget:
+                break
+
+        # periodic dump of instrumentation
+        if self.instrumentation != None:
+            self.instrumentation.try_dump()
+
+        return self.is_empty() and not self.is_pending()
+
     def try_dispatch_once(self) -> bool:
+        if self.dispatch_type == EventDispatchType.POOL:
+            return self.dispatch_pool()
+
         # until all accumulated tasks finished, looping
         if self.curr_task == None:
             # early-out when tasks is empty
             if self.is_empty():
                 return False
 
-            # get new current task
-            self.curr_task = self.tasks.get()
+            # get new current task (None when remaining tasks are expired or deferred)
+            self.curr_task = self.get_ready_task()
+            if self.curr_task == None:
+                return False
 
             # execute task
-            self.curr_task.execute()
+            self.execute_task(self.curr_task)
+
+        # process commands are still running
+        if self.curr_task.is_executing():
+            return False
 
         # if task is sync-task, waiting
         if not self.curr_task.is_sync_task():
-            # no pending call, so call callback directly
-            self.curr_task.callback()
-
-            # mark task is finished
+            # no pending call, so call callback directly and mark task is finished
+            self.callback_task(self.curr_task)
             self.curr_task = None
         else:
             # get the event tag
             event_tag = self.curr_task.event_tag
 
-            # waiting until signal is triggered
-            wait_time = 1.0 / 120  # 120Hz
-            finished = self.sync_barrier.wait(event_tag, wait_time)
+            # check signal without blocking: the wait is kept by sync_barrier until signal arrives
+            finished = self.sync_barrier.wait(event_tag, 0)
 
             if finished:
-                # execute callback
-                self.curr_task.callback()
-
-                # finished to execute task
+                # execute callback and finish task
+                self.callback_task(self.curr_task)
                 self.curr_task = None
 
-        return (not self.is_empty()) and (not self.is_pending())
+        return (not self.is_empty()) and self.curr_task == None
+
+    def submit_task(self, task: EventTask):
+        # sync task owns its event_tag until signal is arrived
+        if task.is_sync_task():
+            self.busy_tags.add(task.event_tag)
+
+        # worker thread waits for process commands, command callbacks are called by dispatch_pool()
+        future = self.get_executor().submit(
+            self.execute_task, task, wait_process_commands=True, defer_callbacks=True
+        )
+        self.running_tasks.append((task, future))
+        return
+
+    def release_tag(self, event_tag: str):
+        """release event_tag and submit next task waiting for the tag"""
+        blocked_tasks = self.blocked_tasks.get(event_tag, None)
+        if blocked_tasks == None:
+            self.busy_tags.discard(event_tag)
+            return
+
+        next_task = blocked_tasks.popleft()
+        if len(blocked_tasks) == 0:
+            self.blocked_tasks.pop(event_tag)
+
+        # tag is handed over to next task
+        self.submit_task(next_task)
+        return
+
+    def dispatch_pool(self) -> bool:
+        """dispatch tasks for EventDispatchType.POOL; callbacks are called on this thread"""
+        # finished tasks
+        if len(self.running_tasks) > 0:
+            running_tasks = []
+            for task, future in self.running_tasks:
+                # callbacks of commands finished in command graph
+                task.callback_completed_commands()
+
+                if not future.done():
+                    running_tasks.append((task, future))
+                    continue
+
+                if future.exception() != None:
+                    Logger.instance().info(
+                        f"[ERROR][SyncEventTaskQueue] task [{task.event_tag}] raised exception: {''.join(traceback.format_exception(future.exception()))}"
+                    )
+                    if task.is_sync_task():
+                        self.release_tag(task.event_tag)
+                    # dependents are not blocked forever by the failed task
+                    self.finish_task(task)
+                    continue
+
+                if task.is_sync_task():
+                    # wait for signal: callback of the future marks the tag as signaled
+                    self.waiting_tasks[task.event_tag] = task
+                    self.sync_barrier.acquire(task.event_tag).add_done_callback(
+                        lambda future: self.signaled_tags.append(future.result())
+                    )
+                else:
+                    self.callback_task(task)
+            self.running_tasks = running_tasks
+
+        # signaled sync tasks
+        while len(self.signaled_tags) > 0:
+            event_tag = self.signaled_tags.popleft()
+
+            task = self.waiting_tasks.pop(event_tag)
+            self.callback_task(task)
+            self.release_tag(event_tag)
+
+        # submit new tasks, drained in batches (single lock acquisition per batch)
+        while True:
+            tasks = self.tasks.drain(self.drain_count)
+            if len(tasks) == 0:
+                break
+
+            for task in tasks:
+                if self.defer_task(task):
+                    continue
+
+                # serialize tasks sharing event_tag
+                if task.is_sync_task() and task.event_tag in self.busy_tags:
+                    if not task.event_tag in self.blocked_tasks:
+                        self.blocked_tasks[task.event_tag] = deque()
+                    self.blocked_tasks[task.event_tag].append(task)
+                    continue
+
+                self.submit_task(task)
+
+        # every available task is dispatched in a single call
+        return False
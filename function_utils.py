@@ -1,21 +1,313 @@
-import inspect
+import weakref
+import threading
+from functools import partial
+from collections import OrderedDict, deque
+from concurrent.futures import Future, Executor, CancelledError
+
+
+class FunctionFuture(Future):
+    """
+    concurrent.futures.Future with chaining
+    - result(time_out)/exception(time_out)/cancel()/add_done_callback() are inherited
+    - then() returns a new future resolved with the return value of function(result):
+      exception and cancellation are propagated to the chained future without calling function
+    - chained function is called on the thread completing the future, unless executor is given
+    """
+
+    def run(self, function) -> bool:
+        """call function and store its return value or exception, False when the future is cancelled"""
+        if not self.set_running_or_notify_cancel():
+            return False
+
+        try:
+            result = function()
+        except BaseException as exception:
+            self.set_exception(exception)
+            return True
+
+        if isinstance(result, Future):
+            # function returned future: flatten
+            result.add_done_callback(self.resolve)
+        else:
+            self.set_result(result)
+        return True
+
+    def resolve(self, source: Future):
+        """complete with the state of the source future"""
+        if not self.running() and not self.set_running_or_notify_cancel():
+            return
+
+        if source.cancelled():
+            self.set_exception(CancelledError())
+        elif source.exception() != None:
+            self.set_exception(source.exception())
+        else:
+            self.set_result(source.result())
+        return
+
+    def then(self, function, executor: Executor = None) -> "FunctionFuture":
+        chained_future = FunctionFuture()
+
+        def on_done(future: Future):
+            if future.cancelled() or future.exception() != None:
+                chained_future.resolve(future)
+                return
+
+            chained_function = partial(function, future.result())
+            if executor != None:
+                executor.submit(chained_future.run, chained_function)
+            else:
+                chained_future.run(chained_function)
+            return
+
+        self.add_done_callback(on_done)
+        return chained_future
+
+    @staticmethod
+    def from_future(source: Future) -> "FunctionFuture":
+        """wrap future (e.g. from ProcessPoolExecutor): cancel() is forwarded to the source future"""
+        future = FunctionFuture()
+        future.add_done_callback(lambda future: source.cancel() if future.cancelled() else None)
+        source.add_done_callback(future.resolve)
+        return future
+
+    @staticmethod
+    def from_result(result) -> "FunctionFuture":
+        future = FunctionFuture()
+        future.set_running_or_notify_cancel()
+        future.set_result(result)
+        return future
 
 
 class FunctionObject:
-    """function object"""
+    """
+    function object
+    - call is pre-bound at construction: the function itself (no arguments) or functools.partial,
+      so call() is a single C-level call without attribute lookup and *args/**kwargs unpacking
+    - function/args/kwargs could still be replaced (call is re-bound), and kwargs is partial's own keyword dict:
+      in-place update like kwargs["file_path"] = ... is visible to call()
+    - call() returns the function's return value, invoke()/submit() return FunctionFuture
+    - is_coroutine is evaluated once per bound function (not on every call)
+    """
+
+    __slots__ = ("_function", "_partial", "_is_coroutine", "call")
 
     def __init__(self, function, *args, **kwargs):
-        self.function = function
-        self.args = args
-        self.kwargs = kwargs
+        self.bind(function, args, kwargs)
+
+    def bind(self, function, args: tuple, kwargs: dict):
+        self._function = function
+        # resolved on the first access of is_coroutine
+        self._is_coroutine = None
+        if len(args) == 0 and len(kwargs) == 0:
+            # no argument, call function directly
+            self._partial = None
+            self.call = function
+        else:
+            self._partial = partial(function, *args, **kwargs)
+            self.call = self._partial
+        return
+
+    def invoke(self, future: FunctionFuture = None) -> FunctionFuture:
+        """call on the current thread, return value or exception is stored to the future (not raised)"""
+        future = future if future != None else FunctionFuture()
+        future.run(self.call)
+        return future
+
+    def submit(self, executor: Executor, future: FunctionFuture = None) -> FunctionFuture:
+        """call on the executor, future could be cancelled until the call is started"""
+        future = future if future != None else FunctionFuture()
+        executor.submit(future.run, self.call)
+        return future
+
+    @property
+    def function(self):
+        return self._function
+
+    @function.setter
+    def function(self, function):
+        self.bind(function, self.args, self.kwargs)
+
+    @property
+    def args(self) -> tuple:
+        return self._partial.args if self._partial != None else ()
+
+    @args.setter
+    def args(self, args: tuple):
+        self.bind(self._function, tuple(args), self.kwargs)
+
+    @property
+    def kwargs(self) -> dict:
+        # caller could update kwargs in-place, so bind to partial to share its keyword dict
+        if self._partial == None:
+            self._partial = partial(self._function)
+            self.call = self._partial
+        return self._partial.keywords
+
+    @kwargs.setter
+    def kwargs(self, kwargs: dict):
+        self.bind(self._function, self.args, dict(kwargs))
+
+    @property
+    def is_coroutine(self) -> bool:
+        """whether function is a coroutine function (call() returns a coroutine)"""
+        if self._is_coroutine == None:
+            import inspect
+
+            self._is_coroutine = inspect.iscoroutinefunction(self._function)
+        return self._is_coroutine
+
+
+class ArgumentBinder:
+    """
+    precompiled mapping of positional/keyword arguments to parameter names
+    - signatures with only positional-or-keyword and keyword-only parameters are bound without BoundArguments
+    - the others (*args, **kwargs, positional-only) fall back to inspect.Signature.bind
+    """
 
-    def call(self):
-        self.function(*self.args, **self.kwargs)
+    def __init__(self, function):
+        # imported on first binding (import time)
+        import inspect
+
+        self.signature = inspect.signature(function)
+
+        # state of function when signature is captured: the binder is stale when any of them is replaced
+        self.validation = ArgumentBinder.get_validation(function)
+
+        self.is_simple = True
+        self.positional_names: list[str] = []
+        self.names: list[str] = []
+        self.defaults: dict = {}
+        for parameter in self.signature.parameters.values():
+            if parameter.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD:
+                self.positional_names.append(parameter.name)
+            elif parameter.kind != inspect.Parameter.KEYWORD_ONLY:
+                self.is_simple = False
+            self.names.append(parameter.name)
+            if parameter.default is not inspect.Parameter.empty:
+                self.defaults[parameter.name] = parameter.default
+        return
+
+    @staticmethod
+    def get_validation(function) -> tuple:
+        return (
+            getattr(function, "__code__", None),
+            getattr(function, "__defaults__", None),
+            getattr(function, "__kwdefaults__", None),
+            getattr(function, "__signature__", None),
+            getattr(function, "__wrapped__", None),
+        )
+
+    def is_valid(self, function) -> bool:
+        validation = ArgumentBinder.get_validation(function)
+        for captured, current in zip(self.validation, validation):
+            if captured is not current:
+                return False
+        return True
+
+    def bind(self, args: tuple, kwargs: dict) -> dict:
+        if not self.is_simple:
+            bound_args = self.signature.bind(*args, **kwargs)
+            bound_args.apply_defaults()
+            return bound_args.arguments
+
+        if len(args) > len(self.positional_names):
+            raise TypeError("too many positional arguments")
+
+        arguments = {}
+        used_kwargs_count = 0
+        for index, name in enumerate(self.names):
+            if index < len(args):
+                if name in kwargs:
+                    raise TypeError(f"multiple values for argument '{name}'")
+                arguments[name] = args[index]
+            elif name in kwargs:
+                arguments[name] = kwargs[name]
+                used_kwargs_count += 1
+            elif name in self.defaults:
+                arguments[name] = self.defaults[name]
+            else:
+                raise TypeError(f"missing a required argument: '{name}'")
+
+        if used_kwargs_count != len(kwargs):
+            unexpected_names = [name for name in kwargs if not name in arguments]
+            raise TypeError(f"got an unexpected keyword argument '{unexpected_names[0]}'")
+
+        return arguments
+
+
+class SignatureCache:
+    """
+    bounded LRU cache of ArgumentBinder keyed by weak reference of function
+    - entry is removed when function is garbage collected (e.g. redefined)
+    - entry is rebuilt when function's __code__/__defaults__/__kwdefaults__/__signature__/__wrapped__ is replaced
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.binders: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+
+        # keys of collected functions, removed from binders by the next get_binder()
+        # - weakref callback could run while self.lock is held by the same thread
+        #   (cyclic gc, or eviction dropping the last reference of __wrapped__), so it does not lock
+        self.collected_keys: deque = deque()
         return
 
+    def get_binder(self, function) -> ArgumentBinder:
+        try:
+            key = weakref.ref(function, self.on_collected)
+        except TypeError:
+            # function is not weak-referenceable, not cached
+            return ArgumentBinder(function)
+
+        with self.lock:
+            binder = self.binders.get(key, None)
+            if binder != None and binder.is_valid(function):
+                self.binders.move_to_end(key)
+                return binder
+
+        binder = ArgumentBinder(function)
+
+        # evicted binders are released after the lock
+        evicted_binders = []
+        with self.lock:
+            self.purge_collected()
+
+            self.binders[key] = binder
+            self.binders.move_to_end(key)
+            while len(self.binders) > self.max_size:
+                evicted_binders.append(self.binders.popitem(last=False))
+        return binder
+
+    def on_collected(self, key):
+        self.collected_keys.append(key)
+        return
+
+    def purge_collected(self):
+        while len(self.collected_keys) > 0:
+            self.binders.pop(self.collected_keys.popleft(), None)
+        return
+
+    def clear(self):
+        with self.lock:
+            self.binders.clear()
+            self.collected_keys.clear()
+        return
+
+
+signature_cache = SignatureCache()
+
 
 def inspect_args(function, *args, **kwargs) -> dict:
     """generate dict for function's [(argument_name, argument_value)...]"""
-    bound_args = inspect.signature(function).bind(*args, **kwargs)
-    bound_args.apply_defaults()
-    return bound_args.arguments
+    # bound method: cache by underlying function, self is excluded from the result
+    self_object = getattr(function, "__self__", None)
+    underlying_function = getattr(function, "__func__", None)
+    if self_object != None and underlying_function != None:
+        binder = signature_cache.get_binder(underlying_function)
+        arguments = binder.bind((self_object,) + args, kwargs)
+        arguments.pop(binder.names[0])
+        return arguments
+
+    return signature_cache.get_binder(function).bind(args, kwargs)
@@ -0,0 +1,46 @@
+""" lazy imports """
+import sys
+import importlib
+import importlib.util
+
+
+def is_module_available(module_name: str) -> bool:
+    """whether module could be imported, without importing it"""
+    if module_name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(module_name) != None
+    except (ImportError, ValueError):
+        return False
+
+
+def lazy_import(module_name: str):
+    """
+    module object which is executed on its first attribute access (importlib.util.LazyLoader)
+    - use at module level for heavy optional third-party modules used only by some functions:
+      paramiko = lazy_import("paramiko")
+    - the module is registered in sys.modules, every importer in the process gets the lazy module:
+      do not use it for standard library modules, import them inside the functions using them instead
+    - submodule is bound to its parent package like a regular import
+    - raise ModuleNotFoundError if module does not exist (check optional module with is_module_available)
+    - before Python 3.12, the first attribute access is not thread-safe: touch the module from one thread
+    """
+    module = sys.modules.get(module_name, None)
+    if module != None:
+        return module
+
+    spec = importlib.util.find_spec(module_name)
+    if spec == None:
+        raise ModuleNotFoundError(f"No module named '{module_name}'", name=module_name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    loader.exec_module(module)
+
+    # bind submodule to its parent package (import parent.child sets parent.child)
+    parent_name, _, child_name = module_name.rpartition(".")
+    if parent_name != "":
+        setattr(importlib.import_module(parent_name), child_name, module)
+    return module
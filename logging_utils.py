@@ -1,11 +1,27 @@
 import os
+import re
+import copy
+import time
+import queue
+import atexit
+import shutil
+import datetime
+import functools
+import threading
 import traceback
+from enum import Enum
+from collections import deque
 
 import logging
 import logging.config
+import logging.handlers
 
 from SGDPyUtil.singleton_utils import SingletonInstance
 from SGDPyUtil.main import get_data_path
+from SGDPyUtil.import_utils import is_module_available
+
+# zstandard is optional, imported by LogCompressor only when it is used
+zstd_available = is_module_available("zstandard")
 
 is_kiwoom_process = False
 
@@ -17,7 +33,411 @@ def propagate_is_kiwoom_process(value):
     return
 
 
+class LogOverflowPolicy(Enum):
+    # caller waits until the writer makes room (no record is lost)
+    BLOCK = 0
+    # the oldest queued record is dropped for the new one
+    DROP_OLDEST = 1
+    # only one of sample_interval records is queued (replacing the oldest), the others are dropped
+    SAMPLE = 2
+
+
+class AsyncLogQueue:
+    """
+    bounded record queue for logging.handlers.QueueHandler (only put_nowait is used by QueueHandler)
+    - memory is bounded by max_size, overflow is handled by LogOverflowPolicy
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        overflow_policy: LogOverflowPolicy = LogOverflowPolicy.DROP_OLDEST,
+        sample_interval: int = 10,
+    ):
+        self.max_size = max(1, max_size)
+        self.overflow_policy = overflow_policy
+        self.sample_interval = max(1, sample_interval)
+
+        self.records: deque[logging.LogRecord] = deque()
+        self.condition = threading.Condition()
+
+        # count of records overflowed while the queue is full
+        self.overflow_count = 0
+        # count of dropped records, reported by AsyncLogWriter
+        self.dropped_count = 0
+        return
+
+    def put_nowait(self, record: logging.LogRecord):
+        with self.condition:
+            if len(self.records) >= self.max_size:
+                if self.overflow_policy == LogOverflowPolicy.BLOCK:
+                    while len(self.records) >= self.max_size:
+                        self.condition.wait()
+                elif self.overflow_policy == LogOverflowPolicy.DROP_OLDEST:
+                    self.records.popleft()
+                    self.dropped_count += 1
+                else:
+                    self.overflow_count += 1
+                    if self.overflow_count % self.sample_interval != 0:
+                        self.dropped_count += 1
+                        return
+                    self.records.popleft()
+                    self.dropped_count += 1
+            else:
+                self.overflow_count = 0
+
+            self.records.append(record)
+            self.condition.notify_all()
+        return
+
+    def get_batch(self, max_count: int, time_out: float) -> list[logging.LogRecord]:
+        """wait up to time_out for any record and pop up to max_count records"""
+        with self.condition:
+            if len(self.records) == 0:
+                self.condition.wait(time_out)
+
+            batch = []
+            while len(self.records) > 0 and len(batch) < max_count:
+                batch.append(self.records.popleft())
+
+            if len(batch) > 0:
+                # wake blocked callers
+                self.condition.notify_all()
+            return batch
+
+    def pop_dropped_count(self) -> int:
+        with self.condition:
+            dropped_count = self.dropped_count
+            self.dropped_count = 0
+            return dropped_count
+
+    def notify(self):
+        with self.condition:
+            self.condition.notify_all()
+        return
+
+
+class AsyncQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler deferring message formatting to AsyncLogWriter
+    - record.msg/args are kept when every argument is immutable primitive (the writer thread formats them,
+      and StructuredLogHandler receives the template), otherwise the message is formatted on the caller
+    """
+
+    primitive_types = (str, int, float, bool, type(None))
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args
+        if args and not (
+            isinstance(args, tuple)
+            and all(type(arg) in AsyncQueueHandler.primitive_types for arg in args)
+        ):
+            return super().prepare(record)
+
+        record = copy.copy(record)
+        if record.exc_info:
+            # traceback is formatted before the frames are changed
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class AsyncLogWriter:
+    """
+    background thread writing records of AsyncLogQueue to handlers
+    - handlers are flushed once per batch instead of once per record
+    - dropped records are reported as a warning record
+    """
+
+    def __init__(
+        self,
+        queue: AsyncLogQueue,
+        handlers: list[logging.Handler],
+        batch_size: int = 256,
+        flush_interval: float = 0.1,
+    ):
+        self.queue = queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.is_running = False
+        self.thread: threading.Thread = None
+        return
+
+    def start(self):
+        if self.is_running:
+            return
+        self.is_running = True
+        self.thread = threading.Thread(
+            target=self.run, name="AsyncLogWriter", daemon=True
+        )
+        self.thread.start()
+        return
+
+    def stop(self):
+        """stop the thread after writing remaining records"""
+        if not self.is_running:
+            return
+        self.is_running = False
+        self.queue.notify()
+        self.thread.join()
+        self.thread = None
+        return
+
+    def run(self):
+        while True:
+            is_running = self.is_running
+            batch = self.queue.get_batch(self.batch_size, self.flush_interval)
+            if len(batch) > 0:
+                self.write(batch)
+            elif not is_running:
+                # stopped and drained
+                break
+        return
+
+    def write(self, batch: list[logging.LogRecord]):
+        dropped_count = self.queue.pop_dropped_count()
+        if dropped_count > 0:
+            batch.insert(
+                0,
+                logging.makeLogRecord(
+                    {
+                        "name": batch[0].name,
+                        "levelno": logging.WARNING,
+                        "levelname": "WARNING",
+                        "msg": f"[AsyncLogWriter] dropped {dropped_count} records (queue is full)",
+                        "created": batch[0].created,
+                        "msecs": batch[0].msecs,
+                    }
+                ),
+            )
+
+        for handler in self.handlers:
+            # stream handlers flush on every emit: suppress it during the batch
+            handler.flush = AsyncLogWriter.skip_flush
+            try:
+                for record in batch:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+            finally:
+                del handler.flush
+                handler.flush()
+        return
+
+    @staticmethod
+    def skip_flush():
+        return
+
+
+class LogCompressor:
+    """
+    background thread compressing rotated log segments and enforcing disk budget of each log file
+    - segment is compressed to a temporary file and renamed: interrupted compression leaves the original segment
+    """
+
+    def __init__(self):
+        # (segment file name, handler) or None to stop
+        self.requests: queue.Queue = queue.Queue()
+        self.thread: threading.Thread = None
+        self.lock = threading.Lock()
+        return
+
+    def request(self, segment_file_name: str, handler: "BudgetRotatingFileHandler"):
+        with self.lock:
+            if self.thread == None or not self.thread.is_alive():
+                self.thread = threading.Thread(
+                    target=self.run, name="LogCompressor", daemon=True
+                )
+                self.thread.start()
+        self.requests.put((segment_file_name, handler))
+        return
+
+    def wait(self):
+        """wait until every requested segment is processed"""
+        self.requests.join()
+        return
+
+    def run(self):
+        while True:
+            segment_file_name, handler = self.requests.get()
+            try:
+                if segment_file_name != None:
+                    ratio = self.compress(segment_file_name, handler.compression)
+                    if ratio != None:
+                        handler.compression_ratio = ratio
+                handler.enforce_budget()
+            except Exception:
+                print(f"[ERROR] failed to compress log [{segment_file_name}]: {traceback.format_exc()}")
+            finally:
+                self.requests.task_done()
+        return
+
+    @staticmethod
+    def compress(file_name: str, compression: str) -> float:
+        """compress file and remove it, return compressed size / original size (None if not compressed)"""
+        if compression == None or not os.path.exists(file_name):
+            return None
+
+        compressed_file_name = f"{file_name}.{'zst' if compression == 'zstd' else 'gz'}"
+        temp_file_name = compressed_file_name + ".tmp"
+        with open(file_name, "rb") as source:
+            if compression == "zstd":
+                import zstandard
+
+                with open(temp_file_name, "wb") as target:
+                    zstandard.ZstdCompressor().copy_stream(source, target)
+            else:
+                import gzip
+
+                with gzip.open(temp_file_name, "wb") as target:
+                    shutil.copyfileobj(source, target, 1024 * 1024)
+
+        original_size = os.path.getsize(file_name)
+        os.replace(temp_file_name, compressed_file_name)
+        os.remove(file_name)
+        return os.path.getsize(compressed_file_name) / max(original_size, 1)
+
+
+log_compressor = LogCompressor()
+
+
+class BudgetRotatingFileHandler(logging.handlers.BaseRotatingHandler):
+    """
+    file handler rotating by size (max_bytes) and by time (interval seconds)
+    - rotation only renames the file: compression and deletion run on LogCompressor thread
+    - rotated segments are compressed with compression ('gzip', 'zstd' or None, 'auto': zstd when zstandard is installed)
+    - oldest segments are deleted while total size of segments exceeds budget_bytes
+    - segments are ordered by <timestamp>.<index> of their names (index increases monotonically),
+      not by mtime: compression rewrites the file
+    - segments waiting for compression are counted at the size estimated by the last compression ratio
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        max_bytes: int = 10 * 1024 * 1024,
+        interval: float = 3600.0,
+        budget_bytes: int = 200 * 1024 * 1024,
+        compression: str = "auto",
+        encoding: str = "utf-8",
+        delay: bool = False,
+    ):
+        super().__init__(filename, "a", encoding=encoding, delay=delay)
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.budget_bytes = budget_bytes
+
+        if compression == "auto":
+            compression = "zstd" if zstd_available else "gzip"
+        elif compression == "zstd" and not zstd_available:
+            compression = "gzip"
+        self.compression = compression
+
+        # compressed size / original size of the last compressed segment (updated by LogCompressor)
+        self.compression_ratio = 0.1
+
+        # segment: <base name>.<YYYYmmdd-HHMMSS>.<index>[.gz|.zst]
+        directory, base_name = os.path.split(self.baseFilename)
+        self.directory = directory
+        self.segment_pattern = re.compile(
+            re.escape(base_name) + r"\.(\d{8}-\d{6})\.(\d+)(\.gz|\.zst)?$"
+        )
+
+        self.rollover_at = time.time() + interval if interval > 0 else None
+
+        # continue the index of the previous run, segments left uncompressed are compressed
+        segments = self.get_segments()
+        self.next_index = max((index for _, _, index in segments), default=-1) + 1
+        for segment_file_name, _, _ in segments:
+            if not segment_file_name.endswith((".gz", ".zst")):
+                log_compressor.request(segment_file_name, self)
+        return
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.rollover_at != None and record.created >= self.rollover_at:
+            return True
+
+        if self.max_bytes > 0:
+            if self.stream == None:
+                self.stream = self._open()
+            # rotate after the segment exceeds max_bytes (message is not formatted twice)
+            if self.stream.tell() >= self.max_bytes:
+                return True
+        return False
+
+    def doRollover(self):
+        if self.stream != None:
+            self.stream.close()
+            self.stream = None
+
+        if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) > 0:
+            time_stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+            # index is never reused (deleted segments keep the order of names)
+            while True:
+                segment_file_name = f"{self.baseFilename}.{time_stamp}.{self.next_index}"
+                self.next_index += 1
+                if not os.path.exists(segment_file_name) and not any(
+                    os.path.exists(segment_file_name + extension)
+                    for extension in (".gz", ".zst")
+                ):
+                    break
+            os.replace(self.baseFilename, segment_file_name)
+            log_compressor.request(segment_file_name, self)
+
+        if self.rollover_at != None:
+            self.rollover_at = time.time() + self.interval
+
+        if not self.delay:
+            self.stream = self._open()
+        return
+
+    def get_segments(self) -> list[tuple[str, int, int]]:
+        """(file name, size, index) of rotated segments from the oldest"""
+        segments = []
+        for entry in os.scandir(self.directory):
+            match = self.segment_pattern.match(entry.name)
+            if match != None and entry.is_file():
+                time_stamp, index = match.group(1), int(match.group(2))
+                segments.append((time_stamp, index, entry.path, entry.stat().st_size))
+        segments.sort()
+        return [(file_name, size, index) for _, index, file_name, size in segments]
+
+    def get_budget_size(self, file_name: str, size: int) -> int:
+        """size counted for the budget: segment waiting for compression is counted as compressed"""
+        if self.compression == None or file_name.endswith((".gz", ".zst")):
+            return size
+        return int(size * self.compression_ratio)
+
+    def enforce_budget(self):
+        if self.budget_bytes <= 0:
+            return
+
+        segments = [
+            (file_name, self.get_budget_size(file_name, size))
+            for file_name, size, _ in self.get_segments()
+        ]
+        total_size = sum(size for _, size in segments)
+        for file_name, size in segments:
+            if total_size <= self.budget_bytes:
+                break
+            try:
+                os.remove(file_name)
+                total_size -= size
+            except OSError:
+                pass
+        return
+
+
 class Logger(SingletonInstance):
+    # (level, method name) replaced by update_level_methods
+    level_methods = (
+        (logging.DEBUG, "debug"),
+        (logging.INFO, "info"),
+        (logging.WARNING, "warning"),
+        (logging.ERROR, "error"),
+    )
+
     def __init__(self, *args, **kwargs):
         global is_kiwoom_process
 
@@ -33,6 +453,11 @@ class Logger(SingletonInstance):
         # set prefix
         self.prefix = prefix_name
 
+        # asynchronous mode (enable_async)
+        self.async_queue: AsyncLogQueue = None
+        self.async_writer: AsyncLogWriter = None
+        self.sync_handlers: list[logging.Handler] = []
+
         # init logging config file and create new instance for logger
         self.init_settings(log_type)
 
@@ -55,24 +480,178 @@ class Logger(SingletonInstance):
                 )
 
             self.logger = logging.getLogger(log_type)
+            self.update_level_methods()
         except:
             print(
                 f"[ERROR] failed to initialize Logger instance: {traceback.format_exc()}"
             )
         return
 
-    def info(self, message):
+    def enable_async(
+        self,
+        max_size: int = 10000,
+        overflow_policy: LogOverflowPolicy = LogOverflowPolicy.DROP_OLDEST,
+        sample_interval: int = 10,
+        batch_size: int = 256,
+        flush_interval: float = 0.1,
+    ):
+        """
+        enqueue records to QueueHandler and write them on background thread
+        - callers only pay for creating record, I/O of handlers is batched by AsyncLogWriter
+        - memory is bounded by max_size records, overflow is handled by overflow_policy
+        """
+        if self.async_writer != None:
+            return
+
+        self.async_queue = AsyncLogQueue(max_size, overflow_policy, sample_interval)
+
+        # move handlers of logger to the writer
+        self.sync_handlers = list(self.logger.handlers)
+        for handler in self.sync_handlers:
+            self.logger.removeHandler(handler)
+        self.logger.addHandler(AsyncQueueHandler(self.async_queue))
+
+        self.async_writer = AsyncLogWriter(
+            self.async_queue, self.sync_handlers, batch_size, flush_interval
+        )
+        self.async_writer.start()
+
+        # write remaining records on exit
+        atexit.register(self.disable_async)
+        return
+
+    def disable_async(self):
+        """write remaining records and restore synchronous handlers"""
+        if self.async_writer == None:
+            return
+        atexit.unregister(self.disable_async)
+
+        for handler in list(self.logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                self.logger.removeHandler(handler)
+        self.async_writer.stop()
+
+        for handler in self.sync_handlers:
+            self.logger.addHandler(handler)
+
+        self.async_queue = None
+        self.async_writer = None
+        self.sync_handlers = []
+        return
+
+    def is_async(self) -> bool:
+        return self.async_writer != None
+
+    def get_handlers(self) -> list[logging.Handler]:
+        """handlers writing records (handlers of AsyncLogWriter in asynchronous mode)"""
+        if self.async_writer != None:
+            return self.sync_handlers
+        return self.logger.handlers
+
+    def enable_structured_log(self, file_name: str = "SGDLog.bin", keep_text_log: bool = True):
+        """
+        write records with StructuredLogHandler (read with structured_log_utils.StructuredLogReader)
+        - keep_text_log=False removes text file handlers (e.g. handle02 of logging.conf)
+        """
+        from SGDPyUtil.structured_log_utils import StructuredLogHandler
+
+        handlers = self.get_handlers()
+        for handler in handlers:
+            if isinstance(handler, StructuredLogHandler):
+                return
+
+        if not keep_text_log:
+            for handler in list(handlers):
+                if isinstance(handler, logging.FileHandler):
+                    self.remove_handler(handler)
+                    handler.close()
+
+        self.add_handler(StructuredLogHandler(file_name))
+        return
+
+    def add_handler(self, handler: logging.Handler):
+        if self.async_writer != None:
+            # list shared with AsyncLogWriter
+            self.sync_handlers.append(handler)
+        else:
+            self.logger.addHandler(handler)
+        return
+
+    def remove_handler(self, handler: logging.Handler):
+        if self.async_writer != None:
+            self.sync_handlers.remove(handler)
+        else:
+            self.logger.removeHandler(handler)
+        return
+
+    def is_enabled(self, level: int) -> bool:
+        """guard for expensive logging blocks"""
+        return self.logger.isEnabledFor(level)
+
+    def set_level(self, level: int):
+        self.logger.setLevel(level)
+        self.update_level_methods()
+        return
+
+    def update_level_methods(self):
+        """
+        replace debug/info/warning/error of disabled levels with no-op
+        - a disabled call costs a single empty call, the message is neither formatted nor prefixed
+        - call again when the level is changed outside of set_level (e.g. logging.config)
+        """
+        for level, method_name in Logger.level_methods:
+            if self.logger.isEnabledFor(level):
+                self.__dict__.pop(method_name, None)
+            else:
+                setattr(self, method_name, Logger.skip)
+        return
+
+    @staticmethod
+    def skip(*args, **kwargs):
+        return
+
+    def log(self, level: int, message, *args, **kwargs):
+        """
+        message is formatted lazily only when level is enabled
+        - %-style format string: formatted with args by logging when the record is written
+        - callable: called without arguments to build the message
+        - kwargs are passed to logging.Logger.log (e.g. exc_info=True)
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+
+        if callable(message):
+            message = message()
+
         # composite message
-        composite_message = self.prefix + message
+        if self.prefix != "":
+            message = self.prefix + message
 
         # logging
-        self.logger.info(composite_message)
+        self.logger.log(level, message, *args, **kwargs)
+        return
+
+    def debug(self, message, *args, **kwargs):
+        self.log(logging.DEBUG, message, *args, **kwargs)
+        return
+
+    def info(self, message, *args, **kwargs):
+        self.log(logging.INFO, message, *args, **kwargs)
+        return
+
+    def warning(self, message, *args, **kwargs):
+        self.log(logging.WARNING, message, *args, **kwargs)
+        return
+
+    def error(self, message, *args, **kwargs):
+        self.log(logging.ERROR, message, *args, **kwargs)
         return
 
 
 def logging_func(desc=""):
     """
     logging delegate for function
+    - logs start/desc/end lines on every call, use profile_func for frequently called functions
     """
 
     def decorator(function):
@@ -82,7 +661,7 @@ def logging_func(desc=""):
             Logger.instance().info(f"[logging_func][start] {function.__name__}")
 
             # if any desc is exists, log the description
-            if desc is not "":
+            if desc != "":
                 Logger.instance().info(f"[logging_func][desc] {desc}")
 
             # execute function
@@ -96,3 +675,210 @@ def logging_func(desc=""):
         return wrapper
 
     return decorator
+
+
+class FunctionStats:
+    """call statistics of function decorated by profile_func"""
+
+    __slots__ = (
+        "name",
+        "desc",
+        "call_count",
+        "exception_count",
+        "total_ns",
+        "max_ns",
+        "lock",
+    )
+
+    def __init__(self, name: str, desc: str = ""):
+        self.name = name
+        self.desc = desc
+        self.call_count = 0
+        self.exception_count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.lock = threading.Lock()
+        return
+
+    def record(self, duration_ns: int, is_exception: bool) -> int:
+        """return call count including this call"""
+        with self.lock:
+            self.call_count += 1
+            if is_exception:
+                self.exception_count += 1
+            self.total_ns += duration_ns
+            if duration_ns > self.max_ns:
+                self.max_ns = duration_ns
+            return self.call_count
+
+    def reset(self):
+        with self.lock:
+            self.call_count = 0
+            self.exception_count = 0
+            self.total_ns = 0
+            self.max_ns = 0
+        return
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "name": self.name,
+                "desc": self.desc,
+                "call_count": self.call_count,
+                "exception_count": self.exception_count,
+                "total_ns": self.total_ns,
+                "max_ns": self.max_ns,
+                "average_ns": self.total_ns / self.call_count if self.call_count > 0 else 0.0,
+            }
+
+
+class FunctionProfiler(SingletonInstance):
+    """
+    per-function statistics of profile_func
+    - summary is logged every report_interval seconds (checked by decorated calls) instead of per-call lines
+    """
+
+    def __init__(self, report_interval: float = 60.0):
+        # name: FunctionStats
+        self.stats: dict[str, FunctionStats] = {}
+        self.lock = threading.Lock()
+
+        # report_interval <= 0: no periodic report (call log_report() explicitly)
+        self.report_interval_ns = int(report_interval * 1_000_000_000)
+        self.next_report_ns = (
+            time.perf_counter_ns() + self.report_interval_ns
+            if self.report_interval_ns > 0
+            else None
+        )
+        return
+
+    def get_stats(self, name: str, desc: str = "") -> FunctionStats:
+        with self.lock:
+            stats = self.stats.get(name, None)
+            if stats == None:
+                stats = FunctionStats(name, desc)
+                self.stats[name] = stats
+            return stats
+
+    def set_report_interval(self, report_interval: float):
+        self.report_interval_ns = int(report_interval * 1_000_000_000)
+        self.next_report_ns = (
+            time.perf_counter_ns() + self.report_interval_ns
+            if self.report_interval_ns > 0
+            else None
+        )
+        return
+
+    def try_report(self, now_ns: int):
+        with self.lock:
+            if self.next_report_ns == None or now_ns < self.next_report_ns:
+                return
+            self.next_report_ns = now_ns + self.report_interval_ns
+        self.log_report()
+        return
+
+    def reset(self):
+        with self.lock:
+            stats_list = list(self.stats.values())
+        for stats in stats_list:
+            stats.reset()
+        return
+
+    def report(self) -> list[dict]:
+        """snapshots of called functions in descending order of total time"""
+        with self.lock:
+            stats_list = list(self.stats.values())
+
+        snapshots = [stats.snapshot() for stats in stats_list]
+        snapshots = [snapshot for snapshot in snapshots if snapshot["call_count"] > 0]
+        snapshots.sort(key=lambda snapshot: snapshot["total_ns"], reverse=True)
+        return snapshots
+
+    def log_report(self, max_count: int = 20):
+        for snapshot in self.report()[:max_count]:
+            Logger.instance().info(
+                "[FunctionProfiler] [%s]%s count[%d] exceptions[%d] total[%.3fms] average[%.1fus] max[%.1fus]",
+                snapshot["name"],
+                f"[{snapshot['desc']}]" if snapshot["desc"] != "" else "",
+                snapshot["call_count"],
+                snapshot["exception_count"],
+                snapshot["total_ns"] / 1_000_000,
+                snapshot["average_ns"] / 1000,
+                snapshot["max_ns"] / 1000,
+            )
+        return
+
+
+def profile_func(desc="", trace_interval: int = 0, profiler: FunctionProfiler = None):
+    """
+    profiling delegate for function (replacement of logging_func for hot functions)
+    - call count, total/max duration (perf_counter_ns) and exceptions are aggregated per function in FunctionProfiler
+    - trace_interval > 0: logs one of trace_interval calls with its duration (sampled tracing)
+    - coroutine function is measured until it returns
+    - FunctionProfiler is resolved on the first call, decorating does not construct it (import time)
+    """
+
+    def decorator(function):
+        import inspect
+
+        name = f"{function.__module__}.{function.__qualname__}"
+        # [FunctionProfiler, FunctionStats] resolved on the first call
+        binding = [profiler, None]
+
+        def on_finished(end_ns: int, duration_ns: int, is_exception: bool):
+            function_profiler, stats = binding
+            if stats == None:
+                if function_profiler == None:
+                    function_profiler = FunctionProfiler.instance()
+                stats = function_profiler.get_stats(name, desc)
+                binding[0], binding[1] = function_profiler, stats
+
+            call_count = stats.record(duration_ns, is_exception)
+
+            if trace_interval > 0 and call_count % trace_interval == 0:
+                Logger.instance().info(
+                    "[profile_func][trace] [%s] call[%d] duration[%.1fus]%s",
+                    stats.name,
+                    call_count,
+                    duration_ns / 1000,
+                    " raised exception" if is_exception else "",
+                )
+
+            next_report_ns = function_profiler.next_report_ns
+            if next_report_ns != None and end_ns >= next_report_ns:
+                function_profiler.try_report(end_ns)
+            return
+
+        if inspect.iscoroutinefunction(function):
+
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                start_ns = time.perf_counter_ns()
+                try:
+                    result = await function(*args, **kwargs)
+                except BaseException:
+                    end_ns = time.perf_counter_ns()
+                    on_finished(end_ns, end_ns - start_ns, True)
+                    raise
+                end_ns = time.perf_counter_ns()
+                on_finished(end_ns, end_ns - start_ns, False)
+                return result
+
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start_ns = time.perf_counter_ns()
+            try:
+                result = function(*args, **kwargs)
+            except BaseException:
+                end_ns = time.perf_counter_ns()
+                on_finished(end_ns, end_ns - start_ns, True)
+                raise
+            end_ns = time.perf_counter_ns()
+            on_finished(end_ns, end_ns - start_ns, False)
+            return result
+
+        return wrapper
+
+    return decorator
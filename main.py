@@ -2,7 +2,6 @@ import sys
 import os
 import shutil
 
-import SGDPyUtil.powershell_utils as powershell_utils
 from SGDPyUtil.singleton_utils import SingletonInstance
 
 
@@ -101,7 +100,9 @@ def prepare_py_env(py_version: str, is_x86=False) -> str:
     if os.path.exists(new_python_path):
         return python_command
 
-    # execute powershell command
+    # execute powershell command (imported here: main is imported by logging_utils)
+    import SGDPyUtil.powershell_utils as powershell_utils
+
     env_settings_powershell = powershell_utils.PowershellInlineScript()
     env_settings_powershell.add_run_as_admin()
     env_settings_powershell.add_command(
@@ -0,0 +1,104 @@
+""" metrics """
+import threading
+
+
+class LatencyHistogram:
+    """
+    HDR-style histogram of durations in nanoseconds
+    - log-linear buckets: every power of two is split into 2^precision_bits sub-buckets,
+      so recorded values keep 1/2^precision_bits relative precision
+    - memory is bounded by the value range, not by the number of samples
+    - thread-safe
+    """
+
+    def __init__(self, precision_bits: int = 5):
+        self.precision_bits = precision_bits
+        self.sub_bucket_count = 1 << precision_bits
+
+        # bucket index: count
+        self.buckets: dict[int, int] = {}
+
+        self.count: int = 0
+        self.total: int = 0
+        self.min: int = None
+        self.max: int = 0
+
+        self.lock = threading.Lock()
+        return
+
+    def bucket_index(self, value: int) -> int:
+        if value < self.sub_bucket_count:
+            return value
+
+        exponent = value.bit_length() - self.precision_bits - 1
+        mantissa = value >> exponent
+        return exponent * self.sub_bucket_count + mantissa
+
+    def bucket_value(self, index: int) -> int:
+        """middle value of the bucket"""
+        if index < self.sub_bucket_count:
+            return index
+
+        exponent = index // self.sub_bucket_count - 1
+        mantissa = index - exponent * self.sub_bucket_count
+        lower = mantissa << exponent
+        upper = ((mantissa + 1) << exponent) - 1
+        return (lower + upper) // 2
+
+    def record(self, value: int):
+        value = max(0, int(value))
+        index = self.bucket_index(value)
+
+        with self.lock:
+            self.buckets[index] = self.buckets.get(index, 0) + 1
+            self.count += 1
+            self.total += value
+            self.min = value if self.min == None else min(self.min, value)
+            self.max = max(self.max, value)
+        return
+
+    def reset(self):
+        with self.lock:
+            self.buckets.clear()
+            self.count = 0
+            self.total = 0
+            self.min = None
+            self.max = 0
+        return
+
+    def percentiles(self, ratios) -> list:
+        """values at ratios (0.0 ~ 1.0) in ascending order of ratios"""
+        with self.lock:
+            if self.count == 0:
+                return [0 for _ in ratios]
+
+            results = []
+            sorted_buckets = sorted(self.buckets.items())
+            bucket_position = 0
+            accumulated_count = 0
+            for ratio in ratios:
+                target_count = max(1, int(self.count * ratio + 0.5))
+                while accumulated_count < target_count:
+                    accumulated_count += sorted_buckets[bucket_position][1]
+                    bucket_position += 1
+                value = self.bucket_value(sorted_buckets[bucket_position - 1][0])
+                # bucket middle value could be out of recorded range
+                results.append(min(max(value, self.min), self.max))
+            return results
+
+    def percentile(self, ratio: float) -> int:
+        return self.percentiles((ratio,))[0]
+
+    def snapshot(self) -> dict:
+        p50, p90, p99, p999 = self.percentiles((0.50, 0.90, 0.99, 0.999))
+        with self.lock:
+            return {
+                "count": self.count,
+                "min": self.min if self.min != None else 0,
+                "max": self.max,
+                "mean": self.total / self.count if self.count > 0 else 0.0,
+                "p50": p50,
+                "p90": p90,
+                "p99": p99,
+                "p999": p999,
+            }
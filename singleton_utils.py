@@ -1,15 +1,35 @@
 # https://wikidocs.net/3693 참고
+import threading
 
 
 class SingletonInstance:
+    """
+    singleton with thread-safe initialization
+    - the first instance() constructs under the lock (double-checked: racing threads construct only once)
+    - after initialization, instance() of the class is replaced with a getter without lock
+    """
+
     __instance = None
 
+    # shared by every singleton class, reentrant for singletons constructing other singletons in __init__
+    __lock = threading.RLock()
+
     @classmethod
     def __getInstance(cls):
         return cls.__instance
 
+    @classmethod
+    def is_initialized(cls) -> bool:
+        """whether the instance is constructed (does not construct it)"""
+        return cls.instance.__func__ is not SingletonInstance.instance.__func__
+
     @classmethod
     def instance(cls, *args, **kwargs):
-        cls.__instance = cls(*args, **kwargs)
-        cls.instance = cls.__getInstance
-        return cls.__instance
+        with SingletonInstance.__lock:
+            # another thread could finish initialization while this thread is waiting for the lock
+            if cls.is_initialized():
+                return cls.instance()
+
+            cls.__instance = cls(*args, **kwargs)
+            cls.instance = cls.__getInstance
+            return cls.__instance
@@ -0,0 +1,436 @@
+""" structured binary log format (StructuredLogHandler) and its streaming reader (StructuredLogReader) """
+import os
+import sys
+import time
+import struct
+import logging
+import argparse
+import datetime
+import traceback
+
+# file header
+MAGIC = b"SGDLOG\x00\x01"
+
+# frame types
+FRAME_TEMPLATE = 1
+FRAME_RECORD = 2
+
+# frame type(B)
+FRAME_TYPE_STRUCT = struct.Struct("<B")
+# template_id(I), length(I), followed by utf-8 template
+TEMPLATE_STRUCT = struct.Struct("<II")
+# timestamp_ns(q), level(B), flags(B), template_id(I), field_count(H), payload_length(I), followed by payload
+RECORD_STRUCT = struct.Struct("<qBBIHI")
+
+# record flags
+FLAG_EXCEPTION = 1
+
+# field types
+FIELD_NONE = 0
+FIELD_INT = 1
+FIELD_FLOAT = 2
+FIELD_STR = 3
+FIELD_BOOL = 4
+# int out of int64 range, stored as decimal string
+FIELD_BIG_INT = 5
+
+INT_STRUCT = struct.Struct("<q")
+FLOAT_STRUCT = struct.Struct("<d")
+LENGTH_STRUCT = struct.Struct("<I")
+
+INT_MIN = -(1 << 63)
+INT_MAX = (1 << 63) - 1
+
+# template_id of records whose message is stored as the only field (not interned)
+RAW_TEMPLATE_ID = 0
+RAW_TEMPLATE = "%s"
+
+
+def encode_fields(values: tuple) -> bytes:
+    chunks = []
+    for value in values:
+        if value is None:
+            chunks.append(b"\x00")
+        elif value is True or value is False:
+            chunks.append(b"\x04\x01" if value else b"\x04\x00")
+        elif isinstance(value, int) and INT_MIN <= value <= INT_MAX:
+            chunks.append(b"\x01" + INT_STRUCT.pack(value))
+        elif isinstance(value, float):
+            chunks.append(b"\x02" + FLOAT_STRUCT.pack(value))
+        elif isinstance(value, int):
+            encoded = str(int(value)).encode("ascii")
+            chunks.append(b"\x05" + LENGTH_STRUCT.pack(len(encoded)) + encoded)
+        else:
+            encoded = str(value).encode("utf-8", "replace")
+            chunks.append(b"\x03" + LENGTH_STRUCT.pack(len(encoded)) + encoded)
+    return b"".join(chunks)
+
+
+def decode_fields(payload: bytes, field_count: int) -> list:
+    values = []
+    offset = 0
+    for _ in range(field_count):
+        field_type = payload[offset]
+        offset += 1
+        if field_type == FIELD_NONE:
+            values.append(None)
+        elif field_type == FIELD_INT:
+            values.append(INT_STRUCT.unpack_from(payload, offset)[0])
+            offset += INT_STRUCT.size
+        elif field_type == FIELD_FLOAT:
+            values.append(FLOAT_STRUCT.unpack_from(payload, offset)[0])
+            offset += FLOAT_STRUCT.size
+        elif field_type == FIELD_BOOL:
+            values.append(payload[offset] != 0)
+            offset += 1
+        else:
+            length = LENGTH_STRUCT.unpack_from(payload, offset)[0]
+            offset += LENGTH_STRUCT.size
+            value = payload[offset : offset + length].decode("utf-8", "replace")
+            values.append(int(value) if field_type == FIELD_BIG_INT else value)
+            offset += length
+    return values
+
+
+class StructuredLogHandler(logging.Handler):
+    """
+    logging handler writing compact binary records instead of formatted text lines
+    - record.msg (%-style template) of record with args is interned: written once per file, records refer to its id
+    - record.args are stored as typed fields (int/float/str/bool/None), message is not formatted on write
+    - timestamp is integer nanoseconds since epoch
+    - record stored with RAW_TEMPLATE_ID has the formatted message as its first field:
+      message without args (e.g. pre-formatted f-string, not worth a template), mapping args,
+      or any record after the template table is full
+    """
+
+    def __init__(self, file_name: str, max_templates: int = 65536):
+        super().__init__()
+        self.file_name = os.path.abspath(file_name)
+        self.max_templates = max_templates
+
+        # template: template_id
+        self.template_ids: dict[str, int] = {}
+        self.stream = None
+        self.open_stream()
+        return
+
+    def open_stream(self):
+        # appending: continue with the templates already written to the file
+        if os.path.exists(self.file_name) and os.path.getsize(self.file_name) >= len(MAGIC):
+            templates, valid_length = StructuredLogReader(self.file_name).scan()
+            self.template_ids = {
+                template: template_id
+                for template_id, template in templates.items()
+                if template_id != RAW_TEMPLATE_ID
+            }
+
+            # frame cut by a crashed writer: appended frames would not be readable after it
+            if valid_length < os.path.getsize(self.file_name):
+                with open(self.file_name, "r+b") as stream:
+                    stream.truncate(valid_length)
+
+            self.stream = open(self.file_name, "ab")
+        else:
+            self.template_ids = {}
+            self.stream = open(self.file_name, "wb")
+            self.stream.write(MAGIC)
+        return
+
+    def get_template_id(self, template: str) -> int:
+        template_id = self.template_ids.get(template, None)
+        if template_id != None:
+            return template_id
+
+        if len(self.template_ids) >= self.max_templates:
+            return RAW_TEMPLATE_ID
+
+        template_id = len(self.template_ids) + 1
+        self.template_ids[template] = template_id
+
+        encoded = template.encode("utf-8", "replace")
+        self.stream.write(
+            FRAME_TYPE_STRUCT.pack(FRAME_TEMPLATE)
+            + TEMPLATE_STRUCT.pack(template_id, len(encoded))
+            + encoded
+        )
+        return template_id
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            timestamp_ns = getattr(record, "created_ns", None)
+            if timestamp_ns == None:
+                timestamp_ns = int(record.created * 1_000_000_000)
+
+            template_id = RAW_TEMPLATE_ID
+            if isinstance(record.args, tuple) and len(record.args) > 0:
+                template = record.msg if isinstance(record.msg, str) else str(record.msg)
+                template_id = self.get_template_id(template)
+
+            if template_id != RAW_TEMPLATE_ID:
+                args = record.args
+            else:
+                # mapping arguments are not stored as fields
+                args = (record.getMessage(),)
+
+            flags = 0
+            if record.exc_info and not record.exc_text:
+                record.exc_text = "".join(traceback.format_exception(*record.exc_info))
+            if record.exc_text:
+                flags |= FLAG_EXCEPTION
+                args = args + (record.exc_text,)
+
+            payload = encode_fields(args)
+            self.stream.write(
+                FRAME_TYPE_STRUCT.pack(FRAME_RECORD)
+                + RECORD_STRUCT.pack(
+                    timestamp_ns,
+                    min(max(record.levelno, 0), 255),
+                    flags,
+                    template_id,
+                    len(args),
+                    len(payload),
+                )
+                + payload
+            )
+        except Exception:
+            self.handleError(record)
+        return
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self.stream != None:
+                self.stream.flush()
+        finally:
+            self.release()
+        return
+
+    def close(self):
+        self.acquire()
+        try:
+            if self.stream != None:
+                self.stream.flush()
+                self.stream.close()
+                self.stream = None
+        finally:
+            self.release()
+        super().close()
+        return
+
+
+class StructuredLogRecord:
+    __slots__ = ("timestamp_ns", "level", "template", "fields", "exception_text")
+
+    def __init__(
+        self,
+        timestamp_ns: int,
+        level: int,
+        template: str,
+        fields: list,
+        exception_text: str = None,
+    ):
+        self.timestamp_ns = timestamp_ns
+        self.level = level
+        self.template = template
+        self.fields = fields
+        self.exception_text = exception_text
+        return
+
+    def get_message(self) -> str:
+        if len(self.fields) == 0:
+            return self.template
+        try:
+            return self.template % tuple(self.fields)
+        except (TypeError, ValueError):
+            return f"{self.template} {self.fields}"
+
+    def format(self) -> str:
+        """same layout as form01 of .conf/logging.conf"""
+        timestamp = datetime.datetime.fromtimestamp(self.timestamp_ns / 1_000_000_000)
+        text = f"{timestamp.strftime('%Y-%m-%dT%H:%M:%S')}.{(self.timestamp_ns // 1_000_000) % 1000:03d}Z|{logging.getLevelName(self.level)}|{self.get_message()}"
+        if self.exception_text != None:
+            text += "\n" + self.exception_text.rstrip("\n")
+        return text
+
+
+class StructuredLogReader:
+    """
+    streaming reader of StructuredLogHandler file
+    - records out of the filter (time range, level, template) are skipped by their fixed-size header,
+      their payload is neither read into fields nor formatted
+    - RAW_TEMPLATE_ID records have no template: template filter is matched on their message field
+    """
+
+    def __init__(self, file_name: str):
+        self.file_name = file_name
+        return
+
+    def read_frames(self, stream):
+        """yield (frame_type, header, stream): the caller reads or skips payload of the frame"""
+        if stream.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"[StructuredLogReader] invalid log file [{self.file_name}]")
+
+        while True:
+            frame_type = stream.read(1)
+            if len(frame_type) == 0:
+                return
+
+            if frame_type[0] == FRAME_TEMPLATE:
+                header = stream.read(TEMPLATE_STRUCT.size)
+                if len(header) < TEMPLATE_STRUCT.size:
+                    return
+                yield FRAME_TEMPLATE, TEMPLATE_STRUCT.unpack(header)
+            elif frame_type[0] == FRAME_RECORD:
+                header = stream.read(RECORD_STRUCT.size)
+                if len(header) < RECORD_STRUCT.size:
+                    return
+                yield FRAME_RECORD, RECORD_STRUCT.unpack(header)
+            else:
+                raise ValueError(
+                    f"[StructuredLogReader] invalid frame type [{frame_type[0]}] in [{self.file_name}]"
+                )
+
+    def read_templates(self) -> dict:
+        """template_id: template"""
+        return self.scan()[0]
+
+    def scan(self) -> tuple[dict, int]:
+        """
+        (templates, length of complete frames) without reading records
+        - scan stops at the first incomplete or invalid frame (e.g. written by a crashed process)
+        """
+        templates = {RAW_TEMPLATE_ID: RAW_TEMPLATE}
+        file_size = os.path.getsize(self.file_name)
+        with open(self.file_name, "rb") as stream:
+            if stream.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"[StructuredLogReader] invalid log file [{self.file_name}]")
+            valid_length = stream.tell()
+            stream.seek(0)
+
+            try:
+                for frame_type, header in self.read_frames(stream):
+                    if frame_type == FRAME_TEMPLATE:
+                        template_id, length = header
+                        encoded = stream.read(length)
+                        if len(encoded) < length:
+                            break
+                        templates[template_id] = encoded.decode("utf-8", "replace")
+                    else:
+                        payload_length = header[5]
+                        if stream.tell() + payload_length > file_size:
+                            break
+                        stream.seek(payload_length, os.SEEK_CUR)
+                    valid_length = stream.tell()
+            except ValueError:
+                # invalid frame type
+                pass
+        return templates, valid_length
+
+    def read(
+        self,
+        start_ns: int = None,
+        end_ns: int = None,
+        min_level: int = logging.NOTSET,
+        template_filter: str = None,
+    ):
+        """
+        yield StructuredLogRecord matching the filter
+        - start_ns <= timestamp_ns < end_ns (None is unbounded)
+        - template_filter: substring of the template (not of the formatted message),
+          substring of the message for RAW_TEMPLATE_ID records
+        """
+        templates = {RAW_TEMPLATE_ID: RAW_TEMPLATE}
+        # template_id: whether the template matches template_filter (RAW_TEMPLATE_ID is matched per record)
+        matched_templates = {RAW_TEMPLATE_ID: True}
+
+        with open(self.file_name, "rb") as stream:
+            for frame_type, header in self.read_frames(stream):
+                if frame_type == FRAME_TEMPLATE:
+                    template_id, length = header
+                    encoded = stream.read(length)
+                    if len(encoded) < length:
+                        # incomplete frame at the end of file
+                        return
+                    template = encoded.decode("utf-8", "replace")
+                    templates[template_id] = template
+                    matched_templates[template_id] = (
+                        template_filter == None or template_filter in template
+                    )
+                    continue
+
+                timestamp_ns, level, flags, template_id, field_count, payload_length = header
+                if (
+                    level < min_level
+                    or (start_ns != None and timestamp_ns < start_ns)
+                    or (end_ns != None and timestamp_ns >= end_ns)
+                    or not matched_templates.get(template_id, False)
+                ):
+                    stream.seek(payload_length, os.SEEK_CUR)
+                    continue
+
+                payload = stream.read(payload_length)
+                if len(payload) < payload_length:
+                    # incomplete frame at the end of file
+                    return
+                fields = decode_fields(payload, field_count)
+                if (
+                    template_id == RAW_TEMPLATE_ID
+                    and template_filter != None
+                    and not (len(fields) > 0 and template_filter in str(fields[0]))
+                ):
+                    continue
+
+                exception_text = None
+                if flags & FLAG_EXCEPTION:
+                    exception_text = fields.pop()
+
+                yield StructuredLogRecord(
+                    timestamp_ns,
+                    level,
+                    templates.get(template_id, RAW_TEMPLATE),
+                    fields,
+                    exception_text,
+                )
+        return
+
+
+def parse_time_ns(value: str) -> int:
+    """ISO 8601 datetime (local time) or integer nanoseconds"""
+    if value == None:
+        return None
+    if value.isdigit():
+        return int(value)
+    return int(datetime.datetime.fromisoformat(value).timestamp() * 1_000_000_000)
+
+
+def main(argv=None) -> int:
+    """print records of structured log file as text lines (python structured_log_utils.py SGDLog.bin ...)"""
+    parser = argparse.ArgumentParser(description="query structured log file")
+    parser.add_argument("file_name")
+    parser.add_argument("--start", help="ISO 8601 datetime or nanoseconds since epoch")
+    parser.add_argument("--end", help="ISO 8601 datetime or nanoseconds since epoch")
+    parser.add_argument("--level", default="NOTSET", help="minimum level (e.g. WARNING)")
+    parser.add_argument("--template", help="substring of message template")
+    parser.add_argument("--count", action="store_true", help="print the count of records only")
+    args = parser.parse_args(argv)
+
+    min_level = logging.getLevelName(args.level.upper())
+    if not isinstance(min_level, int):
+        min_level = int(args.level)
+
+    start_time = time.perf_counter()
+    count = 0
+    for record in StructuredLogReader(args.file_name).read(
+        parse_time_ns(args.start), parse_time_ns(args.end), min_level, args.template
+    ):
+        count += 1
+        if not args.count:
+            sys.stdout.write(record.format() + "\n")
+
+    if args.count:
+        sys.stdout.write(f"{count} records ({time.perf_counter() - start_time:.3f}s)\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,6 @@
-import queue
+import os
+import re
+import time
 import threading
 
 from SGDPyUtil.singleton_utils import SingletonInstance
@@ -6,18 +8,71 @@ from SGDPyUtil.logging_utils import Logger
 
 
 class ProcessItem:
-    def __init__(self, process_name, process_instance):
+    # max length of sampled line
+    max_line_size = 1024
+
+    def __init__(self, process_name, process_instance, log_file_name, buffer_size):
         self.name = process_name
         self.instance = process_instance
-        self.stdout = queue.Queue()
+
+        # child output is written to the log file by the reader thread (large buffered writes)
+        self.log_file_name = log_file_name
+        self.log_file = open(log_file_name, "ab", buffering=buffer_size)
+
+        # statistics updated by the reader thread
+        self.lock = threading.Lock()
+        self.line_count = 0
+        self.byte_count = 0
+        # last line of the output (sampled for the summary)
+        self.last_line = b""
+        # incomplete line at the end of the last chunk (only used by the reader thread)
+        self.partial_line = b""
+        self.is_finished = False
+
+        # statistics at the last summary
+        self.summary_time = time.monotonic()
+        self.summary_line_count = 0
+        self.summary_byte_count = 0
+        return
+
+    def record(self, chunk: bytes):
+        # last complete line of the chunk (chunk could start or end in the middle of a line)
+        last_line = None
+        end = chunk.rfind(b"\n")
+        if end >= 0:
+            start = chunk.rfind(b"\n", 0, end) + 1
+            last_line = chunk[start:end] if start > 0 else self.partial_line + chunk[:end]
+            self.partial_line = chunk[end + 1 :][-ProcessItem.max_line_size :]
+        else:
+            self.partial_line = (self.partial_line + chunk)[-ProcessItem.max_line_size :]
+
+        with self.lock:
+            self.line_count += chunk.count(b"\n")
+            self.byte_count += len(chunk)
+            if last_line != None and len(last_line.strip()) > 0:
+                self.last_line = last_line.rstrip(b"\r")[: ProcessItem.max_line_size]
         return
 
 
 class ProcessManager(SingletonInstance):
-    def __init__(self, *args, **kargs):
+    def __init__(
+        self,
+        log_directory="ProcessLogs",
+        summary_interval=5.0,
+        buffer_size=1024 * 1024,
+        *args,
+        **kargs,
+    ):
         # define process container (unique_process_name, process)
         self.process_container = {}
 
+        # child outputs are written to <log_directory>/<process_name>.log
+        self.log_directory = log_directory
+        self.buffer_size = buffer_size
+
+        # Logger receives only a summary per process every summary_interval seconds
+        self.summary_interval = summary_interval
+
         return
 
     def add_process(self, process_name, process_instance):
@@ -28,20 +83,41 @@ class ProcessManager(SingletonInstance):
             return False
 
         # try to add new process
+        os.makedirs(self.log_directory, exist_ok=True)
+        log_file_name = os.path.join(
+            self.log_directory, re.sub(r"[^\w.-]", "_", process_name) + ".log"
+        )
         self.process_container[process_name] = ProcessItem(
-            process_name, process_instance
+            process_name, process_instance, log_file_name, self.buffer_size
+        )
+        Logger.instance().info(
+            f"[SUCCESS] succssfully add new process[{process_name}] log[{log_file_name}]"
         )
-        Logger.instance().info(f"[SUCCESS] succssfully add new process[{process_name}]")
 
         # define entry function running in stdout_thread
-        def enqueue_process_stdout(process_item: ProcessItem):
-            for line in iter(process_item.instance.stdout.readline, b""):
-                process_item.stdout.put(f"[{process_item.name}]{line}")
+        def write_process_stdout(process_item: ProcessItem):
+            stdout = process_item.instance.stdout
+            # binary stdout: read as much as available instead of line by line
+            read1 = getattr(stdout, "read1", None)
+
+            while True:
+                chunk = read1(self.buffer_size) if read1 != None else stdout.readline()
+                if not chunk:
+                    break
+                if isinstance(chunk, str):
+                    chunk = chunk.encode("utf-8", "replace")
+
+                process_item.log_file.write(chunk)
+                process_item.record(chunk)
+
+            process_item.log_file.flush()
+            with process_item.lock:
+                process_item.is_finished = True
             return
 
-        # make thread to log stdout
+        # make thread to write stdout
         stdout_thread = threading.Thread(
-            target=enqueue_process_stdout,
+            target=write_process_stdout,
             args=(self.process_container[process_name],),
             daemon=True,
         )
@@ -50,19 +126,54 @@ class ProcessManager(SingletonInstance):
         return True
 
     def tick(self):
+        now = time.monotonic()
+        finished_process_names = []
 
         # looping process
         for process_name, process_item in self.process_container.items():
-
-            # log accumulated stdout lines
-            while not process_item.stdout.empty():
-                # get the line
-                line = process_item.stdout.get()
-
-                # log the stdout line
-                Logger.instance().info(f"[{process_item.name}]{line}")
+            with process_item.lock:
+                is_finished = process_item.is_finished
+                if not is_finished and now - process_item.summary_time < self.summary_interval:
+                    continue
+
+                line_count = process_item.line_count - process_item.summary_line_count
+                byte_count = process_item.byte_count - process_item.summary_byte_count
+                last_line = process_item.last_line
+                elapsed_time = max(now - process_item.summary_time, 1e-6)
+
+                process_item.summary_time = now
+                process_item.summary_line_count = process_item.line_count
+                process_item.summary_byte_count = process_item.byte_count
+
+            # log summary of accumulated stdout
+            if line_count > 0 or byte_count > 0:
+                Logger.instance().info(
+                    "[%s] lines[%d] (%.0f lines/s, %.1f KB/s) last[%s]",
+                    process_name,
+                    line_count,
+                    line_count / elapsed_time,
+                    byte_count / elapsed_time / 1024,
+                    last_line.decode("utf-8", "replace"),
+                )
+
+            if is_finished:
+                finished_process_names.append(process_name)
+
+        for process_name in finished_process_names:
+            process_item = self.process_container.pop(process_name)
+            process_item.log_file.close()
+            Logger.instance().info(
+                "[%s] output finished lines[%d] bytes[%d] log[%s]",
+                process_name,
+                process_item.line_count,
+                process_item.byte_count,
+                process_item.log_file_name,
+            )
 
         return
 
     def terminate(self):
+        # flush buffered child outputs
+        for process_item in self.process_container.values():
+            process_item.log_file.flush()
         return
@@ -1,29 +1,360 @@
 import time
+import heapq
+import threading
+import traceback
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor, Future
 
 from SGDPyUtil.logging_utils import Logger
 from SGDPyUtil.function_utils import FunctionObject
 
 
+class TimerScheduleType(Enum):
+    """how TimerItem measures the time to execute"""
+
+    # remain_time is decreased by tick duration and reset after execution (lateness is lost)
+    ELAPSED = 0
+    # absolute deadline on time.monotonic_ns(), lateness is carried over to the next deadline
+    MONOTONIC = 1
+
+
+class TimerCatchUpPolicy(Enum):
+    """what TimerScheduleType.MONOTONIC timer does when it missed one or more periods"""
+
+    # execute once for all missed periods
+    COALESCE = 0
+    # execute once per missed period
+    FIRE_ALL = 1
+    # drop the execution when any period is missed
+    SKIP = 2
+
+
+class TimerExecutionType(Enum):
+    """where TimerItem executes its function"""
+
+    # execute inline in TimerContext.tick()
+    INLINE = 0
+    # execute in TimerContext's worker pool, skip the execution while previous one is running (overrun)
+    POOL = 1
+
+
+class TimerStats:
+    """per-timer execution counters (times in seconds)"""
+
+    __slots__ = (
+        "execute_count",
+        "overrun_count",
+        "total_latency",
+        "max_latency",
+        "total_duration",
+        "max_duration",
+    )
+
+    # counters are updated by worker threads, critical sections are tiny so share single lock
+    lock = threading.Lock()
+
+    def __init__(self):
+        self.execute_count: int = 0
+        self.overrun_count: int = 0
+
+        # latency: from the deadline fired to the start of function
+        self.total_latency: float = 0.0
+        self.max_latency: float = 0.0
+
+        # duration: time spent in function
+        self.total_duration: float = 0.0
+        self.max_duration: float = 0.0
+        return
+
+    def record_execution(self, latency: float, duration: float):
+        with self.lock:
+            self.execute_count += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+            self.total_duration += duration
+            self.max_duration = max(self.max_duration, duration)
+        return
+
+    def record_overrun(self):
+        with self.lock:
+            self.overrun_count += 1
+        return
+
+    def average_latency(self) -> float:
+        if self.execute_count == 0:
+            return 0.0
+        return self.total_latency / self.execute_count
+
+    def average_duration(self) -> float:
+        if self.execute_count == 0:
+            return 0.0
+        return self.total_duration / self.execute_count
+
+
+class TimerProfiler:
+    """profiler hook for TimerContext: records time spent in each timer's function"""
+
+    def __init__(self, max_samples: int = 1024):
+        # name: [count, total_ns, max_ns, samples]
+        self.records: dict[str, list] = {}
+
+        # number of samples kept per timer for percentiles (ring buffer)
+        self.max_samples = max_samples
+
+        # records are updated by worker threads
+        self.lock = threading.Lock()
+        return
+
+    def record(self, name: str, duration_ns: int):
+        with self.lock:
+            record = self.records.get(name, None)
+            if record == None:
+                record = [0, 0, 0, []]
+                self.records[name] = record
+
+            record[0] += 1
+            record[1] += duration_ns
+            record[2] = max(record[2], duration_ns)
+
+            samples = record[3]
+            if len(samples) < self.max_samples:
+                samples.append(duration_ns)
+            else:
+                samples[record[0] % self.max_samples] = duration_ns
+        return
+
+    def reset(self):
+        with self.lock:
+            self.records.clear()
+        return
+
+    def report(self) -> list:
+        """[(name, count, total_ns, max_ns, p50_ns, p99_ns)...] sorted by total time"""
+        results = []
+        with self.lock:
+            for name, (count, total_ns, max_ns, samples) in self.records.items():
+                sorted_samples = sorted(samples)
+                p50_ns = sorted_samples[int((len(sorted_samples) - 1) * 0.50)]
+                p99_ns = sorted_samples[int((len(sorted_samples) - 1) * 0.99)]
+                results.append((name, count, total_ns, max_ns, p50_ns, p99_ns))
+
+        results.sort(key=lambda result: result[2], reverse=True)
+        return results
+
+    def log_report(self, top_count: int = 20):
+        for name, count, total_ns, max_ns, p50_ns, p99_ns in self.report()[:top_count]:
+            Logger.instance().info(
+                f"[TimerProfiler] [{name}] count[{count}] total[{total_ns / 1_000_000:.3f}ms] max[{max_ns / 1000:.1f}us] p50[{p50_ns / 1000:.1f}us] p99[{p99_ns / 1000:.1f}us]"
+            )
+        return
+
+
 class TimerItem:
-    def __init__(self, name: str, repeat_time: float, function: FunctionObject):
+    """
+    timers are allocated in large numbers, so they are slotted (no __dict__)
+    - sys.getsizeof: TimerItem 152 bytes, TimerStats 80 bytes, FunctionObject 64 bytes
+    - about 470 bytes per registered timer in total (LINEAR, measured by benchmark_utils.benchmark_timer_memory)
+      and 570 bytes with HEAP; it was 780/900 bytes with dict-backed objects
+    - subclasses without __slots__ get __dict__ back as usual
+    """
+
+    __slots__ = (
+        "name",
+        "repeat_time",
+        "function",
+        "schedule_type",
+        "catch_up_policy",
+        "remain_time",
+        "repeat_time_ns",
+        "deadline_ns",
+        "execution_type",
+        "executor",
+        "future",
+        "loop",
+        "task",
+        "stats",
+        "profiler",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        repeat_time: float,
+        function: FunctionObject,
+        schedule_type: TimerScheduleType = TimerScheduleType.ELAPSED,
+        catch_up_policy: TimerCatchUpPolicy = TimerCatchUpPolicy.COALESCE,
+        execution_type: TimerExecutionType = TimerExecutionType.INLINE,
+    ):
         self.name: str = name
         self.repeat_time = repeat_time
+
+        # coroutine function (or plain callable) without arguments is wrapped by FunctionObject
+        if function != None and not isinstance(function, FunctionObject):
+            function = FunctionObject(function)
         self.function: FunctionObject = function
 
+        # schedule
+        self.schedule_type = schedule_type
+        self.catch_up_policy = catch_up_policy
+
         # elapsed time
         self.remain_time: float = self.repeat_time
+
+        # absolute deadline (time.monotonic_ns) to execute function
+        self.repeat_time_ns: int = int(self.repeat_time * 1_000_000_000)
+        self.deadline_ns: int = None
+
+        # execution
+        self.execution_type = execution_type
+        # worker pool assigned by TimerContext for TimerExecutionType.POOL
+        self.executor: ThreadPoolExecutor = None
+        # last execution in worker pool
+        self.future: Future = None
+        # event loop assigned by AsyncTimerDriver to run coroutine functions
+        self.loop: "asyncio.AbstractEventLoop" = None
+        # last execution of coroutine function
+        self.task: "asyncio.Task" = None
+        self.stats = TimerStats()
+        # profiler assigned by TimerContext.set_profiler()
+        self.profiler: TimerProfiler = None
         return
 
     def reset(self):
         self.remain_time = self.repeat_time
         return
 
+    def schedule(self, now_ns: int):
+        """(re)start the timer from now_ns"""
+        self.deadline_ns = now_ns + self.repeat_time_ns
+        return
+
+    def execute(self):
+        # execute timer function
+        self.invoke(self.function)
+        return
+
+    def invoke(self, function: FunctionObject, state=None) -> bool:
+        """
+        execute function inline or in worker pool depending on execution_type
+        - state holds future/task of the last execution of function (the timer itself by default)
+        - return False when the fire is skipped (previous execution is still running, or no event loop)
+        """
+        fire_time = time.perf_counter()
+        state = state if state != None else self
+
+        # coroutine function is executed as a task in the event loop
+        if function.is_coroutine:
+            if self.loop == None:
+                Logger.instance().info(
+                    f"[ERROR] timer [{self.name}] has coroutine function, drive TimerContext with AsyncTimerDriver"
+                )
+                return False
+
+            # previous execution is still running, skip this one
+            if state.task != None and not state.task.done():
+                self.stats.record_overrun()
+                return False
+
+            state.task = self.loop.create_task(self.run_async(function, fire_time))
+            return True
+
+        if self.execution_type == TimerExecutionType.POOL and self.executor != None:
+            # previous execution is still running, skip this one
+            if state.future != None and not state.future.done():
+                self.stats.record_overrun()
+                return False
+
+            state.future = self.executor.submit(self.run, function, fire_time)
+            return True
+
+        self.run(function, fire_time)
+        return True
+
+    def run(self, function: FunctionObject, fire_time: float):
+        start_time = time.perf_counter()
+        try:
+            function.call()
+        except:
+            # exception in worker pool is not visible to anyone, log it
+            if self.execution_type != TimerExecutionType.POOL:
+                raise
+            Logger.instance().info(
+                f"[ERROR] timer [{self.name}] raised exception: {traceback.format_exc()}"
+            )
+        finally:
+            end_time = time.perf_counter()
+            self.record_execution(fire_time, start_time, end_time)
+        return
+
+    async def run_async(self, function: FunctionObject, fire_time: float):
+        import asyncio
+
+        start_time = time.perf_counter()
+        try:
+            await function.call()
+        except asyncio.CancelledError:
+            raise
+        except:
+            Logger.instance().info(
+                f"[ERROR] timer [{self.name}] raised exception: {traceback.format_exc()}"
+            )
+        finally:
+            end_time = time.perf_counter()
+            self.record_execution(fire_time, start_time, end_time)
+        return
+
+    def record_execution(self, fire_time: float, start_time: float, end_time: float):
+        self.stats.record_execution(start_time - fire_time, end_time - start_time)
+        if self.profiler != None:
+            self.profiler.record(self.name, int((end_time - start_time) * 1_000_000_000))
+        return
+
+    def fire(self, now_ns: int):
+        """execute function for passed deadline and advance deadline_ns past now_ns"""
+        if self.schedule_type == TimerScheduleType.ELAPSED:
+            self.execute()
+            self.reset()
+            # zero repeat_time is executed once per tick
+            self.deadline_ns = now_ns + max(self.repeat_time_ns, 1)
+            return
+
+        # zero repeat_time is executed once per tick
+        if self.repeat_time_ns <= 0:
+            self.execute()
+            self.deadline_ns = now_ns + 1
+            return
+
+        # number of whole periods missed after the deadline
+        missed_count = (now_ns - self.deadline_ns) // self.repeat_time_ns
+
+        if self.catch_up_policy == TimerCatchUpPolicy.FIRE_ALL:
+            for _ in range(missed_count + 1):
+                self.execute()
+        elif self.catch_up_policy == TimerCatchUpPolicy.SKIP:
+            if missed_count == 0:
+                self.execute()
+        else:
+            self.execute()
+
+        # keep the phase: lateness is carried over to the next deadline
+        self.deadline_ns = self.deadline_ns + (missed_count + 1) * self.repeat_time_ns
+        self.remain_time = (self.deadline_ns - now_ns) / 1_000_000_000
+
+        return
+
     def tick(self, duration: float):
+        if self.schedule_type == TimerScheduleType.MONOTONIC:
+            now_ns = time.monotonic_ns()
+            if self.deadline_ns == None:
+                self.schedule(now_ns)
+            elif self.deadline_ns <= now_ns:
+                self.fire(now_ns)
+            return
+
         # if it is ready to execute function
         if self.remain_time < 0.0:
             # execute timer function
-            self.function.call()
+            self.execute()
 
             # reset remain_time
             self.reset()
@@ -35,12 +366,18 @@ class TimerItem:
 
 
 class SequenceItem:
+    __slots__ = ("name", "function", "once", "future", "task")
+
     def __init__(self, name, function: FunctionObject, once=False):
         self.name = name
         self.function = function
 
         # whether we call this sequence item once and remove item from sequence timer
         self.once = once
+
+        # last execution in worker pool / event loop (overrun is detected per item)
+        self.future: Future = None
+        self.task: "asyncio.Task" = None
         return
 
     def call(self):
@@ -51,32 +388,133 @@ class SequenceItem:
 class PendingSeqenceItemType(Enum):
     ADD = 0
     REMOVE = 1
+    # item_or_name is list of SequenceItem/name
+    ADD_MANY = 2
+    REMOVE_MANY = 3
 
 
 class PendingSequenceItem:
+    __slots__ = ("item_or_name", "type")
+
     def __init__(self, type: PendingSeqenceItemType, item_or_name):
         self.item_or_name = item_or_name
         self.type = type
 
 
+class SequenceRingNode:
+    __slots__ = ("item", "prev", "next")
+
+    def __init__(self, item: SequenceItem):
+        self.item = item
+        self.prev: SequenceRingNode = self
+        self.next: SequenceRingNode = self
+
+
+class SequenceRing:
+    """circular doubly-linked list of SequenceItem indexed by name: O(1) add/remove and round-robin rotation"""
+
+    def __init__(self):
+        self.nodes: dict[str, SequenceRingNode] = {}
+
+        # node to execute next
+        self.cursor: SequenceRingNode = None
+        return
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __contains__(self, name):
+        return name in self.nodes
+
+    def __iter__(self):
+        """iterate items in rotation order starting from cursor"""
+        node = self.cursor
+        for _ in range(len(self.nodes)):
+            yield node.item
+            node = node.next
+
+    def get(self, name) -> SequenceItem:
+        node = self.nodes.get(name, None)
+        return node.item if node != None else None
+
+    def add(self, item: SequenceItem):
+        node = SequenceRingNode(item)
+        self.nodes[item.name] = node
+
+        if self.cursor == None:
+            self.cursor = node
+            return
+
+        # insert before cursor: new item is executed at the end of current round
+        node.prev = self.cursor.prev
+        node.next = self.cursor
+        self.cursor.prev.next = node
+        self.cursor.prev = node
+        return
+
+    def remove(self, name) -> SequenceItem:
+        node = self.nodes.pop(name)
+
+        if len(self.nodes) == 0:
+            self.cursor = None
+        else:
+            if self.cursor is node:
+                self.cursor = node.next
+            node.prev.next = node.next
+            node.next.prev = node.prev
+
+        return node.item
+
+    def peek(self) -> SequenceItem:
+        """item to execute next (cursor is not advanced)"""
+        return self.cursor.item
+
+    def rotate(self) -> SequenceItem:
+        """return item to execute and advance cursor"""
+        node = self.cursor
+        self.cursor = node.next
+        return node.item
+
+
 class TimerSequenceItem(TimerItem):
     """timer which has multiple functions to execute them in rotation"""
 
-    def __init__(self, name: str, repeat_time: float):
+    __slots__ = ("sequence", "ring", "pending_items")
+
+    def __init__(
+        self,
+        name: str,
+        repeat_time: float,
+        schedule_type: TimerScheduleType = TimerScheduleType.ELAPSED,
+        catch_up_policy: TimerCatchUpPolicy = TimerCatchUpPolicy.COALESCE,
+        execution_type: TimerExecutionType = TimerExecutionType.INLINE,
+    ):
         # init TimerItem class member variables
-        super().__init__(name, repeat_time, None)
+        super().__init__(
+            name, repeat_time, None, schedule_type, catch_up_policy, execution_type
+        )
 
-        # sequence number
+        # sequence number (number of executed sequence items)
         self.sequence = 0
 
-        # list of items
-        self.item_names = []  # this is for rotating to execute sequence item by index
-        self.items = {}
+        # sequence items in rotation
+        self.ring = SequenceRing()
         # pending sequence items
         self.pending_items = []
 
         return
 
+    @property
+    def item_names(self) -> list:
+        return [item.name for item in self.ring]
+
+    @property
+    def items(self) -> dict:
+        return {item.name: item for item in self.ring}
+
+    def get_sequence_item(self, name) -> SequenceItem:
+        return self.ring.get(name)
+
     def add_sequence_item(self, item: SequenceItem):
         pending_item = PendingSequenceItem(PendingSeqenceItemType.ADD, item)
         self.pending_items.append(pending_item)
@@ -87,58 +525,93 @@ class TimerSequenceItem(TimerItem):
         self.pending_items.append(pending_item)
         return
 
-    def tick(self, duration: float):
+    def add_sequence_items(self, items: list):
+        pending_item = PendingSequenceItem(PendingSeqenceItemType.ADD_MANY, list(items))
+        self.pending_items.append(pending_item)
+        return
+
+    def remove_sequence_items(self, names: list):
+        pending_item = PendingSequenceItem(
+            PendingSeqenceItemType.REMOVE_MANY, list(names)
+        )
+        self.pending_items.append(pending_item)
+        return
+
+    def add_to_ring(self, sequence_item: SequenceItem):
+        if sequence_item.name in self.ring:
+            Logger.instance().info(
+                f"[ERROR] overlapped sequence item [{sequence_item.name}]"
+            )
+            return
+        self.ring.add(sequence_item)
+        return
+
+    def remove_from_ring(self, name: str):
+        if not (name in self.ring):
+            Logger.instance().info(f"[ERROR] no sequence item exists [{name}]")
+            return
+        self.ring.remove(name)
+        return
+
+    def process_pending_items(self):
         # process pending items
         for item in self.pending_items:
             if item.type == PendingSeqenceItemType.ADD:
                 """ADD PENDING SEQUENCE ITEM"""
-                sequence_item: SequenceItem = item.item_or_name
-                if sequence_item.name in self.items:
-                    Logger.instance().info(
-                        f"[ERROR] overlapped sequence item [{item.name}]"
-                    )
-                    continue
-                self.items[sequence_item.name] = sequence_item
-                self.item_names.append(sequence_item.name)
+                self.add_to_ring(item.item_or_name)
 
             elif item.type == PendingSeqenceItemType.REMOVE:
                 """REMOVE PENDING SEQUENCE ITEM"""
-                name: str = item.item_or_name
-                if not (name in self.items):
-                    Logger.instance().info(f"[ERROR] no sequence item exists [{name}]")
-                    continue
-                self.items.pop(name)
-                self.item_names.pop(self.item_names.index(name))
+                self.remove_from_ring(item.item_or_name)
 
-        # empty pending items
-        self.pending_items.clear()
+            elif item.type == PendingSeqenceItemType.ADD_MANY:
+                """ADD PENDING SEQUENCE ITEMS"""
+                for sequence_item in item.item_or_name:
+                    self.add_to_ring(sequence_item)
 
-        # if it is ready to execute function
-        if self.remain_time < 0.0:
-            # only execute if there are any function to execute
-            if len(self.item_names) > 0:
-                # find slot index by sequence
-                index_to_execute = self.sequence % len(self.item_names)
+            elif item.type == PendingSeqenceItemType.REMOVE_MANY:
+                """REMOVE PENDING SEQUENCE ITEMS"""
+                for name in item.item_or_name:
+                    self.remove_from_ring(name)
 
-                # find function to execute
-                name = self.item_names[index_to_execute]
+        # empty pending items
+        self.pending_items.clear()
 
-                # sequence item to execute
-                sequence_item = self.items[name]
-                sequence_item.function.call()
+        return
 
-                # if sequence item is removed after execution, remove item
-                if sequence_item.once:
-                    self.remove_sequence_item(name)
+    def execute(self):
+        # pending items could be accumulated since last tick (TimerContextType.HEAP skips non-due ticks)
+        self.process_pending_items()
+
+        # only execute if there are any function to execute
+        if len(self.ring) > 0:
+            # sequence item to execute
+            sequence_item = self.ring.peek()
+
+            # skipped (previous execution of the item is still running): retry the same item on next fire
+            # - raising item is executed, so the rotation advances past it
+            is_skipped = False
+            try:
+                is_skipped = not self.invoke(sequence_item.function, sequence_item)
+            finally:
+                if not is_skipped:
+                    # if sequence item is removed after execution, remove item directly (no pending round-trip)
+                    if sequence_item.once:
+                        self.ring.remove(sequence_item.name)
+                    else:
+                        self.ring.rotate()
+
+                    # increase sequence number
+                    self.sequence += 1
 
-                # increase sequence number
-                self.sequence += 1
+        return
 
-            # reset remain_time
-            self.reset()
+    def tick(self, duration: float):
+        # process pending items
+        self.process_pending_items()
 
-        # update remain_time
-        self.remain_time = self.remain_time - duration
+        # tick as TimerItem
+        super().tick(duration)
 
         return
 
@@ -149,6 +622,8 @@ class PendingTimerType(Enum):
 
 
 class PendingTimerItem:
+    __slots__ = ("timer_or_name", "type", "callback_func")
+
     def __init__(self, type: PendingTimerType, timer_or_name, callback: FunctionObject):
         self.timer_or_name = timer_or_name
         self.type = type
@@ -159,26 +634,73 @@ class PendingTimerItem:
             self.callback_func.call()
 
 
+class TimerContextType(Enum):
+    """how TimerContext finds timers to execute"""
+
+    # tick every timer on every frame: O(total timers) per tick
+    LINEAR = 0
+    # min-heap of deadlines: O(due timers * log(total timers)) per tick
+    HEAP = 1
+
+
 class TimerContext:
-    def __init__(self):
+    def __init__(
+        self,
+        context_type: TimerContextType = TimerContextType.LINEAR,
+        max_workers: int = 4,
+    ):
+        self.context_type = context_type
+
+        # worker pool for TimerExecutionType.POOL timers (created on demand)
+        self.max_workers = max_workers
+        self.executor: ThreadPoolExecutor = None
+
+        # event loop to run coroutine functions (assigned by AsyncTimerDriver)
+        self.loop: "asyncio.AbstractEventLoop" = None
+        # called when register_timer/unregister_timer is requested (AsyncTimerDriver wakes up)
+        self.pending_listener: FunctionObject = None
+
+        # profiler hook recording time spent in timer functions
+        self.profiler: TimerProfiler = None
+
         self.timers: dict[str, TimerItem] = {}
-        self.tick_time = time.time()
+        # monotonic clock: durations are not distorted by wall-clock jumps
+        self.tick_time = time.monotonic()
 
         # pending list
         self.pending_timers: list[PendingTimerItem] = []
 
+        # TimerContextType.HEAP: heap of (deadline_ns, handle, name)
+        # - unregistered timers are not removed from the heap, they are discarded when their entry is popped
+        # - handle is used to detect stale entries (re-registered timer with same name)
+        self.deadlines: list[tuple[int, int, str]] = []
+        self.deadline_handles: dict[str, int] = {}
+        self.next_handle: int = 0
+
+        return
+
+    def schedule_timer(self, timer: TimerItem):
+        # push timer's deadline and mark it as the only valid entry for the timer
+        handle = self.next_handle
+        self.next_handle += 1
+        self.deadline_handles[timer.name] = handle
+        heapq.heappush(self.deadlines, (timer.deadline_ns, handle, timer.name))
         return
 
     def register_timer(self, item: TimerItem, callback: FunctionObject = None):
         self.pending_timers.append(
             PendingTimerItem(PendingTimerType.ADD, item, callback)
         )
+        if self.pending_listener != None:
+            self.pending_listener.call()
         return
 
     def unregister_timer(self, name, callback: FunctionObject = None):
         self.pending_timers.append(
             PendingTimerItem(PendingTimerType.REMOVE, name, callback)
         )
+        if self.pending_listener != None:
+            self.pending_listener.call()
         return
 
     def get_timer(self, name):
@@ -187,6 +709,33 @@ class TimerContext:
 
         return self.timers[name]
 
+    def get_timer_stats(self, name) -> TimerStats:
+        if not name in self.timers:
+            return None
+
+        return self.timers[name].stats
+
+    def set_profiler(self, profiler: TimerProfiler):
+        """set profiler hook to all timers (None to disable)"""
+        self.profiler = profiler
+        for _, timer_item in self.timers.items():
+            timer_item.profiler = profiler
+        return
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        if self.executor == None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="TimerContext"
+            )
+        return self.executor
+
+    def shutdown(self, wait=True):
+        """shutdown worker pool"""
+        if self.executor != None:
+            self.executor.shutdown(wait=wait)
+            self.executor = None
+        return
+
     def tick(self):
         # process pending timers
         for item in self.pending_timers:
@@ -194,10 +743,21 @@ class TimerContext:
                 """ADD PENDING TIMER"""
                 timer: TimerItem = item.timer_or_name
                 if timer.name in self.timers:
-                    Logger.instance().info(f"[ERROR] overlapped timer [{timer.time}]")
+                    Logger.instance().info(f"[ERROR] overlapped timer [{timer.name}]")
                     continue
                 self.timers[timer.name] = timer
 
+                # assign worker pool
+                if timer.execution_type == TimerExecutionType.POOL:
+                    timer.executor = self.get_executor()
+                timer.loop = self.loop
+                timer.profiler = self.profiler
+
+                # schedule first deadline
+                timer.schedule(time.monotonic_ns())
+                if self.context_type == TimerContextType.HEAP:
+                    self.schedule_timer(timer)
+
                 # call callback
                 item.callback()
 
@@ -209,20 +769,178 @@ class TimerContext:
                     continue
                 self.timers.pop(name)
 
+                # invalidate the deadline entry in the heap
+                self.deadline_handles.pop(name, None)
+
                 # call callback
                 item.callback()
 
         # clear pending_timers
         self.pending_timers.clear()
 
+        # compact the heap when stale entries dominate (frequent register/unregister)
+        if len(self.deadlines) > 2 * len(self.deadline_handles) + 64:
+            self.compact_deadlines()
+
         # calculate duration
-        duration = time.time() - self.tick_time
+        duration = time.monotonic() - self.tick_time
 
-        # tick timer
-        for _, timer_item in self.timers.items():
-            timer_item.tick(duration)
+        if self.context_type == TimerContextType.HEAP:
+            self.tick_deadlines(time.monotonic_ns())
+        else:
+            # tick timer
+            for _, timer_item in self.timers.items():
+                timer_item.tick(duration)
 
         # update tick_time
-        self.tick_time = time.time()
+        self.tick_time = time.monotonic()
+
+        return
+
+    def next_deadline_ns(self) -> int:
+        """earliest deadline of TimerContextType.HEAP, None when there is no timer"""
+        while len(self.deadlines) > 0:
+            deadline_ns, handle, name = self.deadlines[0]
+            if self.deadline_handles.get(name, None) == handle:
+                return deadline_ns
+
+            # discard stale entry
+            heapq.heappop(self.deadlines)
+
+        return None
+
+    def compact_deadlines(self):
+        """remove stale entries from the heap"""
+        self.deadlines = [
+            entry
+            for entry in self.deadlines
+            if self.deadline_handles.get(entry[2], None) == entry[1]
+        ]
+        heapq.heapify(self.deadlines)
+        return
+
+    def tick_deadlines(self, now_ns: int):
+        """execute timers whose deadline is passed (TimerContextType.HEAP)"""
+        while len(self.deadlines) > 0 and self.deadlines[0][0] <= now_ns:
+            _, handle, name = heapq.heappop(self.deadlines)
+
+            # discard stale entry (unregistered or re-registered timer)
+            if self.deadline_handles.get(name, None) != handle:
+                continue
+
+            # execute timer function and schedule next deadline
+            # - the entry is already popped: reschedule even if the function raises
+            timer_item = self.timers[name]
+            try:
+                timer_item.fire(now_ns)
+            finally:
+                # function raised before its deadline is advanced: retry on the next period
+                # (unchanged deadline would be popped first again and starve the other due timers)
+                if timer_item.deadline_ns <= now_ns:
+                    timer_item.deadline_ns = now_ns + max(timer_item.repeat_time_ns, 1)
+                self.schedule_timer(timer_item)
+
+        return
+
+
+class AsyncTimerDriver:
+    """
+    drive TimerContext(TimerContextType.HEAP) from asyncio event loop
+    - instead of polling TimerContext.tick(), sleep until the next deadline with loop.call_at()
+    - timers having coroutine function are executed as tasks in the event loop
+    """
+
+    def __init__(self, context: TimerContext):
+        self.context = context
+        self.loop: "asyncio.AbstractEventLoop" = None
+
+        # scheduled wake-up for the next deadline
+        self.handle: "asyncio.TimerHandle" = None
+        # wake-up requested by register_timer/unregister_timer
+        self.wake_requested = False
+
+        # set when stop() is called
+        self.stopped: "asyncio.Event" = None
+        return
+
+    def start(self, loop: "asyncio.AbstractEventLoop" = None) -> bool:
+        if self.context.context_type != TimerContextType.HEAP:
+            Logger.instance().info(
+                f"[ERROR] AsyncTimerDriver requires TimerContextType.HEAP context"
+            )
+            return False
+
+        # asyncio is imported only by coroutine timers and AsyncTimerDriver (import time)
+        import asyncio
+
+        self.loop = loop if loop != None else asyncio.get_running_loop()
+
+        # run coroutine functions in the loop
+        self.context.loop = self.loop
+        for _, timer_item in self.context.timers.items():
+            timer_item.loop = self.loop
+
+        # wake up whenever timers are registered or unregistered
+        self.context.pending_listener = FunctionObject(self.request_wake)
+
+        self.wake()
+        return True
+
+    def stop(self):
+        if self.handle != None:
+            self.handle.cancel()
+            self.handle = None
+
+        self.context.pending_listener = None
+        if self.stopped != None:
+            self.stopped.set()
+        return
+
+    async def run(self):
+        """run until stop() is called"""
+        import asyncio
+
+        self.stopped = asyncio.Event()
+        if not self.start():
+            return
+        await self.stopped.wait()
+        return
+
+    def request_wake(self):
+        # could be called from any thread, coalesce multiple requests into single wake-up
+        if self.wake_requested:
+            return
+        self.wake_requested = True
+        self.loop.call_soon_threadsafe(self.wake)
+        return
+
+    def wake(self):
+        self.wake_requested = False
+        self.handle = None
+
+        # execute due timers and process pending timers
+        # - exception of inline timer is logged: the driver keeps waking up for the other timers
+        try:
+            self.context.tick()
+        except:
+            Logger.instance().info(
+                f"[ERROR] AsyncTimerDriver timer raised exception: {traceback.format_exc()}"
+            )
+        finally:
+            self.schedule_next()
+        return
+
+    def schedule_next(self):
+        if self.handle != None:
+            self.handle.cancel()
+            self.handle = None
+
+        # no timer, sleep until any timer is registered
+        deadline_ns = self.context.next_deadline_ns()
+        if deadline_ns == None:
+            return
 
+        # convert monotonic deadline to loop time
+        delay = max(0, deadline_ns - time.monotonic_ns()) / 1_000_000_000
+        self.handle = self.loop.call_at(self.loop.time() + delay, self.wake)
         return
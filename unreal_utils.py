@@ -1,4 +1,3 @@
-from lib2to3.pytree import Base
 import os
 import subprocess
 import shutil
@@ -155,31 +154,69 @@ class PluginGenerator(SourceGenerator):
     def __init__(self, plugin_name: str, plugin_directory: str):
         super().__init__(plugin_name, plugin_directory)
 
-    def generate(self):
+    # sub folders of plugin directory
+    folder_names = ["Source", "Content", "Config"]
+
+    def generate_directory(self):
         # generate directory (if exists, remove directory and re-create directory)
         if os.path.isdir(self.directory):
             shutil.rmtree(self.directory)
         os.mkdir(self.directory)
 
-        # generate 'Source' folder
-        source_folder_path = os.path.join(self.directory, "Source")
-        os.mkdir(source_folder_path)
-
-        # generate 'Content' folder
-        content_folder_path = os.path.join(self.directory, "Content")
-        os.mkdir(content_folder_path)
-
-        # generate 'Config'
-        config_folder_path = os.path.join(self.directory, "Config")
-        os.mkdir(config_folder_path)
+    def generate_folder(self, folder_name: str):
+        folder_path = os.path.join(self.directory, folder_name)
+        os.mkdir(folder_path)
 
+    def generate_descriptor(self):
         # generate .uplugin file
         plugin_descriptor = PluginDescriptor(self.name)
         plugin_descriptor.save(self.directory)
 
+    def generate(self):
+        self.generate_directory()
+
+        # generate 'Source', 'Content' and 'Config' folder
+        for folder_name in self.folder_names:
+            self.generate_folder(folder_name)
+
+        self.generate_descriptor()
+
         # execute GenerateProjectFile.bat
         super().execute_generated_project_files()
 
+    def generate_task(self) -> EventTask:
+        """
+        generate() as command graph:
+        directory -> (folders, .uplugin in parallel) -> GenerateProjectFiles.bat
+        """
+        event_task = EventTask()
+
+        directory_command = EventCommand(FunctionObject(self.generate_directory))
+        event_task.add_command(directory_command)
+
+        content_commands = []
+        for folder_name in self.folder_names:
+            content_commands.append(
+                EventCommand(
+                    FunctionObject(self.generate_folder, folder_name)
+                ).depends_on(directory_command)
+            )
+        content_commands.append(
+            EventCommand(FunctionObject(self.generate_descriptor)).depends_on(
+                directory_command
+            )
+        )
+        for content_command in content_commands:
+            event_task.add_command(content_command)
+
+        event_task.add_command(
+            EventCommand(
+                FunctionObject(self.execute_generated_project_files)
+            ).depends_on(*content_commands)
+        )
+
+        return event_task
+
 
 # Unreal Build.cs file's string template
 build_cs_template = """
@@ -854,28 +891,18 @@ def programmer_assistant_setup():
             with dpg.group(horizontal=True, horizontal_spacing=0):
 
                 def generate_plugin():
-                    def generate_plugin_internal():
-                        plugin_name = (
-                            UnrealProgrammerAssistantContext.instance().plugin_name
-                        )
-                        plugin_path = (
-                            UnrealProgrammerAssistantContext.instance().plugin_path
-                        )
-
-                        if not os.path.isdir(plugin_path):
-                            Logger.instance().info(
-                                f"[ERROR] failed to find plugin path! [{plugin_path}]"
-                            )
-                            return
+                    plugin_name = UnrealProgrammerAssistantContext.instance().plugin_name
+                    plugin_path = UnrealProgrammerAssistantContext.instance().plugin_path
 
-                        plugin_generator = PluginGenerator(plugin_name, plugin_path)
-                        plugin_generator.generate()
+                    if not os.path.isdir(plugin_path):
+                        Logger.instance().info(
+                            f"[ERROR] failed to find plugin path! [{plugin_path}]"
+                        )
+                        return
 
-                    event_task = EventTask()
-                    event_task.add_command(
-                        EventCommand(FunctionObject(generate_plugin_internal))
-                    )
-                    DearPyGuiApp.instance().add_task(event_task)
+                    # plugin files are generated by command graph
+                    plugin_generator = PluginGenerator(plugin_name, plugin_path)
+                    DearPyGuiApp.instance().add_task(plugin_generator.generate_task())
 
                 dpg.add_spacer(width=441)
                 dpg.add_button(